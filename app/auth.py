@@ -22,13 +22,10 @@ class JWTAuthentication(authentication.BasicAuthentication):
             request(HttpRequest): request
 
         Returns:
-            username(str): 用户名
-            token(str): token
+            None: 认证逻辑未实现，按DRF约定返回None表示未认证，交由后续认证类处理
         """
         # TODO 逻辑待补充
-        user = ""
-        session = ""
-        return user, session
+        return None
 
 
 class CasAuthentication(authentication.BasicAuthentication):
@@ -41,13 +38,10 @@ class CasAuthentication(authentication.BasicAuthentication):
             request(HttpRequest): request
 
         Returns:
-            username(str): 用户名
-            token(str): token
+            None: 认证逻辑未实现，按DRF约定返回None表示未认证，交由后续认证类处理
         """
         # TODO 逻辑待补充
-        user = ""
-        session = ""
-        return user, session
+        return None
 
 
 class LdapAuthentication(authentication.BasicAuthentication):
@@ -60,10 +54,7 @@ class LdapAuthentication(authentication.BasicAuthentication):
             request(HttpRequest): request
 
         Returns:
-            username(str): 用户名
-            token(str): token
+            None: 认证逻辑未实现，按DRF约定返回None表示未认证，交由后续认证类处理
         """
         # TODO 逻辑待补充
-        user = ""
-        session = ""
-        return user, session
+        return None
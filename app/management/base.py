@@ -9,6 +9,9 @@ Record:
     2023/9/19 Create file.
 
 """
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from django.core.management.base import BaseCommand
 
 from app.utils.formatter import output_formatter
@@ -20,24 +23,28 @@ class SingleArgBaseCommand(BaseCommand):
     help_info = """Help Info"""
     action = "action"  # 参数名称
     action_choice = tuple()
+    _dispatch: Mapping = MappingProxyType({})  # action与处理函数的映射，首次实例化时按类生成
 
-    def __new__(cls):
-        """实现类创建时的方法校验
+    def __new__(cls, *args, **kwargs):
+        """实现类创建时的方法校验，并生成action分发表
+        Args:
+            *args(list): 可变参数，由BaseCommand.__init__处理
+            **kwargs(dict): 可变关键字参数，由BaseCommand.__init__处理，如stdout、stderr、no_color
         Returns:
             cls(object): 类
         """
-        error_list = []
-        for choice in cls.action_choice:
-            try:
-                getattr(cls, choice)
-            except AttributeError:
-                error_list.append(choice)
-
-        if len(error_list) > 0:
+        if '_dispatch' in cls.__dict__:
+            return BaseCommand.__new__(cls)
+
+        error_list = [choice for choice in cls.action_choice if not hasattr(cls, choice)]
+
+        if error_list:
             error = output_formatter(
                 f"Command action {error_list} undefined, please contact your administrator!", "red"
             )
             raise AttributeError(error)
+
+        cls._dispatch = MappingProxyType({choice: getattr(cls, choice) for choice in cls.action_choice})
         return BaseCommand.__new__(cls)
 
     def add_arguments(self, parser):
@@ -59,5 +66,4 @@ class SingleArgBaseCommand(BaseCommand):
             **options: 可变关键字参数
         """
         action = options.get(self.action)
-        run_func = getattr(self, action)
-        run_func()
+        self._dispatch[action](self)
@@ -9,10 +9,10 @@ Record:
     2023/9/19 Create file.
 
 """
-import importlib
-
 from django.core.management.commands.makemigrations import Command as MakemigrationsCommand
 
+from app.management.commands.syncmigrate import Command as SyncCommand
+
 
 class Command(MakemigrationsCommand):
     """重载django的makemigrations命令，增加自定义操作"""
@@ -41,11 +41,8 @@ class Command(MakemigrationsCommand):
         # 执行migrations文件同步，从关联的数据库中将保存的migrations文件读取到本地项目中
         load = options['load']
         if load:
-            command = importlib.import_module('common.management.commands.syncmigrate')
             self.stdout.write("开始读取迁移文件......")
-            sync_cmd = getattr(command, 'Command')
-            sync = sync_cmd()
-            sync.load()
+            SyncCommand(stdout=self.stdout, stderr=self.stderr, no_color=options['no_color']).load()
             self.stdout.write("迁移文件读取完成......")
 
         super(Command, self).handle(*args, **options)
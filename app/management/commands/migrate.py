@@ -9,10 +9,10 @@ Record:
     2023/9/19 Create file.
 
 """
-import importlib
-
 from django.core.management.commands.migrate import Command as MigrateCommand
 
+from app.management.commands.syncmigrate import Command as SyncCommand
+
 
 class Command(MigrateCommand):
     """重载django的migrate命令，增加自定义操作"""
@@ -21,9 +21,6 @@ class Command(MigrateCommand):
         super(Command, self).handle(*args, **options)
 
         # 执行migrations文件同步，将本地生成的迁移文件保存到关联的数据库中
-        command = importlib.import_module('common.management.commands.syncmigrate')
         self.stdout.write("开始同步迁移文件......")
-        sync_cmd = getattr(command, 'Command')
-        sync = sync_cmd()
-        sync.save()
+        SyncCommand(stdout=self.stdout, stderr=self.stderr, no_color=options['no_color']).save()
         self.stdout.write("迁移文件同步完成......")
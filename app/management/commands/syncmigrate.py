@@ -20,14 +20,21 @@ Record:
     2023/9/19 Create file.
 
 """
+import hashlib
 import json
 import os
+import zlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import MappingProxyType
 
 from django.conf import settings
+from django.db import transaction
 
+from app import params
 from app.management.base import SingleArgBaseCommand
 from app.models import MigrationsHistory
-from app.utils.formatter import output_formatter
 
 
 class Command(SingleArgBaseCommand):
@@ -36,22 +43,29 @@ class Command(SingleArgBaseCommand):
     help_info = """同步迁移文件，save为保存，load为加载，initial为初始化"""
     action_choice = ('save', 'load', 'initial')
     migrations_dir_name = "migrations"
+    _app_migrations_dir = None  # migrations目录缓存，INSTALLED_APPS在进程生命周期内不会变化
+    max_workers = 8  # 按app并行读写迁移文件的最大线程数
 
     def get_app_migrations_dir(self):
-        """获取当前项目下所有app的migrations目录
+        """获取当前项目下所有app的migrations目录，结果在首次计算后缓存
 
         Returns:
-            app_migrations_dir(list): migrations目录列表
+            app_migrations_dir(MappingProxyType): migrations目录映射，key为app路径，value为migrations目录
         """
+        if self._app_migrations_dir is not None:
+            return self._app_migrations_dir
+
         app_migrations_dir = dict()
         for app in settings.INSTALLED_APPS:
-            app_path = os.sep.join(app.split("."))
+            app_path = app.replace(".", os.sep)
             abs_app_path = os.path.join(settings.BASE_DIR, app_path)
 
             if os.path.exists(abs_app_path):
                 absolute_dir = os.path.join(abs_app_path, self.migrations_dir_name)
                 app_migrations_dir[app_path] = absolute_dir
-        return app_migrations_dir
+
+        type(self)._app_migrations_dir = MappingProxyType(app_migrations_dir)
+        return self._app_migrations_dir
 
     @staticmethod
     def get_app_migrations_file(path):
@@ -63,16 +77,91 @@ class Command(SingleArgBaseCommand):
         Returns:
             app_migrations_file(list): migrations文件的绝对路径列表
         """
-        app_migrations_file = []
+        if not os.path.exists(path):
+            return []
 
-        if os.path.exists(path):
-            _, _, file_list = list(os.walk(path))[0]
-            file_list.remove("__init__.py")
-            for file in file_list:
-                if file == "__init__.py" or file.split(".")[-1] == 'pyc':
-                    continue
-                app_migrations_file.append(os.path.join(path, file))
-        return app_migrations_file
+        # 只读取当前目录下的文件，不递归遍历__pycache__等子目录
+        with os.scandir(path) as entries:
+            return [
+                entry.path for entry in entries
+                if entry.is_file() and entry.name.endswith(".py") and entry.name != "__init__.py"
+            ]
+
+    @staticmethod
+    def decode_file_content(content):
+        """解析数据库中保存的迁移文件内容，兼容历史版本以json格式保存的按行列表
+
+        Args:
+            content(str): 数据库中保存的文件内容
+
+        Returns:
+            content(str): 迁移文件的原始文本
+        """
+        try:
+            lines = json.loads(content)
+        except ValueError:
+            return content
+        return "".join(lines) if isinstance(lines, list) else content
+
+    def get_migrations_content(self, content_format, file_content, compressed_content):
+        """根据存储格式获取迁移记录对应的文件文本
+
+        Args:
+            content_format(str): 文件内容格式
+            file_content(str): 文本格式的文件内容
+            compressed_content(bytes|memoryview): 压缩格式的文件内容
+
+        Returns:
+            content(str): 迁移文件的原始文本
+        """
+        if content_format == params.MIGRATIONS_CONTENT_ZLIB:
+            return zlib.decompress(compressed_content).decode('UTF-8')
+        return self.decode_file_content(file_content)
+
+    def get_max_workers(self, app_migrations_dir):
+        """获取并行处理迁移文件的线程数
+
+        Args:
+            app_migrations_dir(Mapping): migrations目录映射
+
+        Returns:
+            max_workers(int): 线程数，至少为1
+        """
+        return max(1, min(self.max_workers, len(app_migrations_dir)))
+
+    def read_app_migrations(self, path):
+        """读取指定migrations目录下的所有迁移文件，并计算其内容摘要
+
+        Args:
+            path(str): migrations目录
+
+        Returns:
+            migrations(list): (文件路径, 文件内容, SHA256摘要)列表
+        """
+        migrations = []
+        for file in self.get_app_migrations_file(path):
+            # 以二进制方式一次性读取，摘要与解码共用同一份数据，已保存的文件无需解码
+            with open(file, "rb") as f:
+                data = f.read()
+            migrations.append((file, data, hashlib.sha256(data).hexdigest()))
+        return migrations
+
+    def write_app_migrations(self, path, migrations_list):
+        """将迁移记录写入指定的migrations目录，同名文件以最新的记录为准
+
+        Args:
+            path(str): migrations目录
+            migrations_list(list): 按保存顺序排列的(文件名, 内容格式, 文本内容, 压缩内容)列表
+        """
+        # 创建migrations文件夹
+        os.makedirs(path, exist_ok=True)
+
+        # 创建migrations文件夹的包文件
+        Path(path, "__init__.py").touch()
+
+        for file_name, *content in migrations_list:
+            with open(os.path.join(path, f"{file_name}.py"), "w", encoding='UTF-8') as file:
+                file.write(self.get_migrations_content(*content))
 
     def save(self):
         """保存当前项目中的migrations文件
@@ -82,19 +171,49 @@ class Command(SingleArgBaseCommand):
         """
         app_migrations_dir = self.get_app_migrations_dir()
 
-        for app, path in app_migrations_dir.items():
-            file_list = self.get_app_migrations_file(path)
-            for file in file_list:
-                with open(file, "r", encoding='UTF-8') as f:
-                    _, status = MigrationsHistory.objects.get_or_create(
-                        app_name=app, file_name=file.split(".")[0],
-                        defaults={"file_content": json.dumps(f.readlines())}
-                    )
-                    if status:
-                        msg = f"app {app} 下的迁移文件 {file} 成功保存至数据库中！"
-                    else:
-                        msg = f"app {app} 下的迁移文件 {file} 已保存，本次对其操作将忽略！"
-                    print(output_formatter(msg))
+        # 一次性查询已保存的迁移文件及其内容摘要，避免逐个文件执行get_or_create；
+        # load以id最大的记录为准，因此按id顺序记录每个文件最新保存的内容摘要
+        existing = dict()
+        latest = dict()
+        queryset = MigrationsHistory.objects.filter(
+            app_name__in=list(app_migrations_dir)
+        ).order_by('id').values_list('id', 'app_name', 'file_name', 'content_sha256')
+        for pk, app_name, file_name, sha256 in queryset.iterator(chunk_size=200):
+            existing[(app_name, file_name, sha256)] = pk
+            latest[(app_name, file_name)] = sha256
+
+        # 文件读取与摘要计算按app并行执行，数据库操作仍在主线程中完成
+        with ThreadPoolExecutor(max_workers=self.get_max_workers(app_migrations_dir)) as executor:
+            app_files = list(executor.map(self.read_app_migrations, app_migrations_dir.values()))
+
+        to_insert = []
+        to_delete = []
+        messages = []
+        for app, files in zip(app_migrations_dir, app_files):
+            for file, data, sha256 in files:
+                file_name = os.path.splitext(file)[0]
+                if latest.get((app, file_name)) == sha256:
+                    messages.append(f"app {app} 下的迁移文件 {file} 已保存，本次对其操作将忽略！")
+                    continue
+
+                # 文件内容回退到了某个历史版本(如A->B->A)，删除该历史记录后重新写入，使其成为最新的记录
+                if (app, file_name, sha256) in existing:
+                    to_delete.append(existing[(app, file_name, sha256)])
+
+                to_insert.append(MigrationsHistory(
+                    app_name=app, file_name=file_name, content_sha256=sha256,
+                    compressed_content=zlib.compress(data), content_format=params.MIGRATIONS_CONTENT_ZLIB,
+                ))
+                messages.append(f"app {app} 下的迁移文件 {file} 成功保存至数据库中！")
+
+        # 依赖(app_name, file_name, content_sha256)唯一约束，由数据库完成冲突去重，多个部署进程并发执行时也不会重复写入
+        with transaction.atomic():
+            if to_delete:
+                MigrationsHistory.objects.filter(pk__in=to_delete).delete()
+            MigrationsHistory.objects.bulk_create(to_insert, ignore_conflicts=True, batch_size=1000)
+        # 汇总后一次性输出，self.style会遵循--no-color参数及终端是否支持彩色输出
+        if messages:
+            self.stdout.write(self.style.SUCCESS("\n".join(messages)))
 
     def load(self):
         """从后端数据库加载当前项目的migrations文件
@@ -104,21 +223,25 @@ class Command(SingleArgBaseCommand):
         """
         app_migrations_dir = self.get_app_migrations_dir()
 
-        for app, path in app_migrations_dir.items():
-            # 创建migrations文件夹
-            if os.path.exists(path) is False:
-                os.mkdir(path)
-
-            # 创建migrations文件夹的包文件
-            f_init = open(os.path.join(path, "__init__.py"), "w", encoding='UTF-8')
-            f_init.close()
-
-            for migrations in MigrationsHistory.objects.filter(app_name=app):
-                with open(os.path.join(path, f"{migrations.file_name}.py"), "w", encoding='UTF-8') as file:
-                    file.write('# coding:utf-8\n')  # 防止乱码
-                    for line in json.loads(migrations.file_content):
-                        file.write(line)
-            print(output_formatter(f"app {app} 历史迁移文件加载完毕！"))
+        # 一次性查询所有app的迁移文件，并按app进行分组
+        app_migrations = defaultdict(list)
+        queryset = MigrationsHistory.objects.filter(
+            app_name__in=list(app_migrations_dir)
+        ).order_by('id').values_list(
+            'app_name', 'file_name', 'content_format', 'file_content', 'compressed_content'
+        )
+        for app_name, *migrations in queryset.iterator(chunk_size=200):
+            app_migrations[app_name].append(migrations)
+
+        # 按app并行写入迁移文件，同一app内的文件仍按保存顺序依次写入
+        with ThreadPoolExecutor(max_workers=self.get_max_workers(app_migrations_dir)) as executor:
+            futures = {
+                app: executor.submit(self.write_app_migrations, path, app_migrations[app])
+                for app, path in app_migrations_dir.items()
+            }
+            for app, future in futures.items():
+                future.result()
+                self.stdout.write(self.style.SUCCESS(f"app {app} 历史迁移文件加载完毕！"))
 
     def initial(self):
         """初始化migrate环境
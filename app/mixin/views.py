@@ -10,20 +10,394 @@ Record:
 
 """
 import copy
-
-from django.db import transaction
-from django.http import HttpResponse
+import functools
+import hashlib
+import logging
+import time
+from types import MappingProxyType
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connection, connections, transaction
+from django.db.models import QuerySet
+from django.http import HttpResponse, QueryDict, StreamingHttpResponse
+from django.utils import timezone
 from rest_framework import status as drf_status
 from rest_framework.response import Response
 from rest_framework import mixins
+from rest_framework.relations import ManyRelatedField
+from rest_framework.serializers import BaseSerializer, ListSerializer, ModelSerializer
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.utils.serializer_helpers import BindingDict
 
 from app import params, permissions
 
+logger = logging.getLogger(__name__)
+
+# 响应消息主体结构模板，extra/data由set_response按需填充
+_MAIN_BODY_TEMPLATE = {
+    "result": "",
+    "total": 0,
+    "extra": None,
+    "data": "",
+}
+
+
+# 查询参数中需要转换的特殊值
+_QUERY_PARAMS_VALUE_MAP = {
+    'undefined': params.QUERY_STRING_ILLEGAL_VALUE,
+    'null': params.QUERY_STRING_ILLEGAL_VALUE,
+    'true': True,
+    'false': False,
+    'None': None,
+}
+
+
+# 模型是否包含数据类型字段的缓存，key为模型类
+_HAS_DATA_TYPE_CACHE = dict()
+
+
+def _has_data_type(model):
+    """判断模型是否包含数据类型字段，结果按模型缓存
+
+    Args:
+        model(models.Model): 模型类
+
+    Returns:
+        has_data_type(bool): 是否包含数据类型字段
+    """
+    has_data_type = _HAS_DATA_TYPE_CACHE.get(model)
+    if has_data_type is None:
+        has_data_type = hasattr(model, params.DATA_TYPE_FIELD)
+        _HAS_DATA_TYPE_CACHE[model] = has_data_type
+    return has_data_type
+
+
+@functools.lru_cache(maxsize=4096)
+def _clear_query_string(value):
+    """清洗字符串类型的查询参数，查询参数的取值在请求之间大量重复，因此缓存清洗结果
+
+    Args:
+        value(str): 待处理查询参数
+
+    Returns:
+        value(any): 清洗完毕后的查询参数
+    """
+    value = value.strip()
+    return _QUERY_PARAMS_VALUE_MAP.get(value, value)
+
+
+def get_list_cache_version(model):
+    """获取模型数据的版本号，列表响应缓存的key中包含该版本号，版本号变更后旧缓存自然失效
+
+    Args:
+        model(models.Model): 模型类
+
+    Returns:
+        version(int): 版本号
+    """
+    key = params.LIST_CACHE_VERSION_KEY.format(model=model._meta.label)
+    version = cache.get(key)
+    if version is None:
+        # 使用当前时间作为初始版本号，版本号被淘汰后重新生成时不会与仍未过期的旧缓存重复
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def bump_list_cache_version(model):
+    """递增模型数据的版本号，使该模型所有的列表响应缓存失效
+
+    Args:
+        model(models.Model): 模型类
+
+    Returns:
+        None
+    """
+    key = params.LIST_CACHE_VERSION_KEY.format(model=model._meta.label)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+# 模型可通过QuerySet.update更新的字段缓存，key为模型类
+_UPDATABLE_FIELDS_CACHE = dict()
+
+
+def _get_updatable_fields(model):
+    """获取模型可通过QuerySet.update更新的字段，结果按模型缓存；主键用于定位数据，不允许通过请求数据改写
+
+    Args:
+        model(models.Model): 模型类
+
+    Returns:
+        fields(MappingProxyType): 字段名与字段attname到attname的映射，不包含主键
+        auto_now_fields(tuple): auto_now字段名，update()不会触发auto_now，需要补充其更新时间
+    """
+    updatable_fields = _UPDATABLE_FIELDS_CACHE.get(model)
+    if updatable_fields is None:
+        fields = dict()
+        auto_now_fields = list()
+        for field in model._meta.concrete_fields:
+            if not field.primary_key:
+                fields[field.name] = fields[field.attname] = field.attname
+            if getattr(field, 'auto_now', False):
+                auto_now_fields.append(field.name)
+        updatable_fields = _UPDATABLE_FIELDS_CACHE[model] = (MappingProxyType(fields), tuple(auto_now_fields))
+    return updatable_fields
+
+
+def _get_update_data(model, data):
+    """从请求数据中筛选出模型的非主键字段，用于QuerySet.update，并补充auto_now字段的更新时间
+
+    Args:
+        model(models.Model): 模型类
+        data(dict): 请求数据
+
+    Returns:
+        error(str): 错误信息，没有错误为None
+        reason(str): 错误原因，没有错误为''
+        update_data(dict): 以attname为key、可直接用于update()的字段字典
+    """
+    fields, auto_now_fields = _get_updatable_fields(model)
+    names = data.keys() & fields.keys()
+
+    # 外键同时以name和attname传入时会重复赋值同一列，无法确定以哪个值为准
+    update_data = {fields[name]: data[name] for name in names}
+    if len(update_data) != len(names):
+        return 'Invalid patch data', '外键字段不能同时以字段名和attname传入', None
+
+    now = timezone.now()
+    for name in auto_now_fields:
+        update_data.setdefault(name, now)
+    return None, '', update_data
+
+
+# 根据序列化器字段推导出的关联数据预加载字段的缓存，key为序列化器类
+_AUTO_RELATED_CACHE = dict()
+
+
+def _get_relation(model, name):
+    """根据序列化器字段的source获取模型中的关联字段，兼容未设置related_name的反向关联(xxx_set)
+
+    Args:
+        model(models.Model): 模型类
+        name(str): 字段名称
+
+    Returns:
+        relation(Field|None): 关联字段，不是关联字段时为None
+    """
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        for field in model._meta.related_objects:
+            if field.get_accessor_name() == name:
+                return field
+        return None
+    return field if field.is_relation else None
+
+
+def _collect_related_lookups(model, fields, prefix, multi, select, prefetch):
+    """遍历序列化器字段，收集序列化时需要访问的关联字段
+
+    Args:
+        model(models.Model): 序列化器对应的模型类
+        fields(BindingDict): 序列化器字段
+        prefix(str): 关联查询的前缀，顶层序列化器为''
+        multi(bool): 前缀路径中是否已经包含多值关联，包含时后续的关联只能通过prefetch_related加载
+        select(set): 收集到的select_related字段
+        prefetch(set): 收集到的prefetch_related字段
+
+    Returns:
+        None
+    """
+    for field in fields.values():
+        if field.write_only or field.source == '*':
+            continue
+
+        nested = field.child if isinstance(field, ListSerializer) else field
+        is_nested = isinstance(nested, BaseSerializer)
+        source_attrs = field.source.split(params.SPLIT_DOT)
+
+        # 嵌套序列化器与多对多字段需要访问整个路径上的关联对象，普通字段只需要访问最后一级之前的关联对象，
+        # 单独的外键字段由DRF通过主键优化直接读取外键列，不需要预加载
+        path = source_attrs if is_nested or isinstance(field, ManyRelatedField) else source_attrs[:-1]
+        if not path:
+            continue
+
+        current, lookup, is_multi = model, prefix, multi
+        for name in path:
+            relation = _get_relation(current, name)
+            if relation is None:
+                break
+
+            lookup = f'{lookup}__{name}' if lookup else name
+            is_multi = is_multi or relation.many_to_many or relation.one_to_many or relation.related_model is None
+            (prefetch if is_multi else select).add(lookup)
+
+            current = relation.related_model
+            if current is None:
+                break
+        else:
+            if is_nested:
+                _collect_related_lookups(current, nested.fields, lookup, is_multi, select, prefetch)
+
+
+def _get_auto_related_lookups(serializer_class):
+    """根据序列化器字段推导关联数据预加载字段，结果按序列化器类缓存
+
+    Args:
+        serializer_class(Serializer): 序列化器类
+
+    Returns:
+        select(tuple): select_related字段
+        prefetch(tuple): prefetch_related字段
+    """
+    lookups = _AUTO_RELATED_CACHE.get(serializer_class)
+    if lookups is not None:
+        return lookups
+
+    select, prefetch = set(), set()
+    model = getattr(getattr(serializer_class, 'Meta', None), 'model', None)
+    if model is not None:
+        try:
+            _collect_related_lookups(model, serializer_class().fields, '', False, select, prefetch)
+        except Exception as error:
+            # 需要特定上下文才能实例化的序列化器无法推导，退回到仅使用显式声明的关联字段
+            logger.warning("序列化器%s的关联字段推导失败: %s", serializer_class.__name__, error)
+            select, prefetch = set(), set()
+
+    lookups = _AUTO_RELATED_CACHE[serializer_class] = (tuple(sorted(select)), tuple(sorted(prefetch)))
+    return lookups
+
+
+# 根据序列化器字段推导出的only()字段的缓存，key为序列化器类，无法推导时为None
+_AUTO_ONLY_CACHE = dict()
+
+
+def _get_auto_only_fields(serializer_class):
+    """根据序列化器字段推导结果集只需要查询的字段，结果按序列化器类缓存；
+    序列化器中存在source为*的字段(如SerializerMethodField)或非模型字段时，无法确定需要读取的字段，不进行推导
+
+    Args:
+        serializer_class(Serializer): 序列化器类
+
+    Returns:
+        fields(tuple|None): only()字段，无法推导时为None
+    """
+    if serializer_class in _AUTO_ONLY_CACHE:
+        return _AUTO_ONLY_CACHE[serializer_class]
+
+    fields = None
+    model = getattr(getattr(serializer_class, 'Meta', None), 'model', None)
+    if model is not None:
+        try:
+            fields = _collect_only_fields(model, serializer_class().fields)
+        except Exception as error:
+            logger.warning("序列化器%s的查询字段推导失败: %s", serializer_class.__name__, error)
+
+    _AUTO_ONLY_CACHE[serializer_class] = fields
+    return fields
+
+
+def _collect_only_fields(model, fields):
+    """收集序列化器字段对应的模型字段
+
+    Args:
+        model(models.Model): 序列化器对应的模型类
+        fields(BindingDict): 序列化器字段
+
+    Returns:
+        fields(tuple|None): only()字段，无法推导时为None
+    """
+    only = {model._meta.pk.name}
+    for field in fields.values():
+        if field.write_only:
+            continue
+        if field.source == '*':
+            return None
+
+        name = field.source.split(params.SPLIT_DOT)[0]
+        try:
+            model_field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            # 反向关联只依赖主键，其他属性或方法可能读取任意字段
+            if _get_relation(model, name) is None:
+                return None
+            continue
+
+        # 外键字段会同时保留外键列，select_related/prefetch_related路径的第一级也因此不会被延迟加载
+        if model_field.concrete:
+            only.add(model_field.name)
+    return tuple(sorted(only))
+
+
+# 构造时绑定了子字段的字段类型，复用字段模板时需要深拷贝
+_NESTED_FIELD_TYPES = (BaseSerializer, ManyRelatedField)
+
+
+class _QueryCounter:
+    """数据库查询计数器，通过connection.execute_wrapper统计执行的SQL数量"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, sql_params, many, context):
+        self.count += 1
+        return execute(sql, sql_params, many, context)
+
 
 class BasicResponseMixin:
     """Http响应混合类"""
-    extra_data = dict()
-    _total_count = 0
+    _total_count = 0  # 数据总量，赋值后即为实例属性
+    serializer_fields_cache = True  # 是否缓存序列化器字段，字段定义依赖请求上下文或实例数据的序列化器需要关闭
+    _fields_cache = dict()  # 序列化器类与未绑定字段模板的映射
+
+    def get_cached_serializer(self, instance, many=False):
+        """获取复用字段模板的序列化器实例
+
+        DRF的序列化器在每次实例化后都会重新执行get_fields()构建全部字段，字段模板按序列化器类缓存后，
+        后续请求只需对模板字段做浅拷贝并重新绑定；嵌套序列化器与many=True的关联字段在构造时就绑定了子字段，
+        浅拷贝会让所有请求共享同一个子字段，因此这类字段需要深拷贝重新构造
+
+        Args:
+            instance(QuerySet|models.Model): 待序列化的数据
+            many(bool): 是否为多条数据
+
+        Returns:
+            serializer(Serializer): 序列化器实例
+        """
+        # 通过get_serializer实例化，保留视图对get_serializer的自定义，序列化器类的解析由get_serializer_class负责缓存
+        serializer = self.get_serializer(instance, many=many)
+        if not self.serializer_fields_cache:
+            return serializer
+
+        target = serializer.child if many else serializer
+        if 'fields' in target.__dict__:  # 自定义的get_serializer已经访问过字段，不再替换
+            return serializer
+
+        target_class = type(target)
+        template = self._fields_cache.get(target_class)
+        if template is None:
+            template = self._fields_cache[target_class] = target.get_fields()
+
+        fields = BindingDict(target)
+        for name, field in template.items():
+            fields[name] = copy.deepcopy(field) if isinstance(field, _NESTED_FIELD_TYPES) else copy.copy(field)
+        target.__dict__['fields'] = fields  # 写入cached_property的缓存位置，跳过get_fields()
+        return serializer
+
+    @property
+    def extra_data(self):
+        """响应数据的额外内容，视图在每次请求时都会重新实例化，因此延迟创建为实例属性，避免在类属性上跨请求累积
+
+        Returns:
+            extra_data(dict): 额外内容
+        """
+        return self.__dict__.setdefault('_extra_data', {})
 
     def set_extra(self, key, value):
         """设置响应数据的额外内容
@@ -41,12 +415,20 @@ class BasicResponseMixin:
         Returns:
             dict: 响应数据结构
         """
-        return {
-            "result": "",
-            "total": 0,
-            "extra": dict(),
-            "data": "",
-        }
+        return _MAIN_BODY_TEMPLATE.copy()
+
+    def invalidate_list_cache(self):
+        """数据变更后，在事务提交时使当前模型的列表响应缓存失效；未开启列表响应缓存的视图直接返回，避免每次写操作都访问缓存
+
+        Returns:
+            None
+        """
+        if not getattr(self, 'list_cache_timeout', None):
+            return
+
+        model = getattr(self.get_queryset(), 'model', None)
+        if model is not None:
+            transaction.on_commit(functools.partial(bump_list_cache_version, model))
 
     def set_response(self, result='success', data=None, extra=None, status=drf_status.HTTP_200_OK):
         """设置响应数据
@@ -60,13 +442,33 @@ class BasicResponseMixin:
         Returns:
             response(Response): 响应数据
         """
-        response = self.main_body
+        response = _MAIN_BODY_TEMPLATE.copy()
         response["result"] = result
-        response["data"] = data if data is not None else dict()
-        response["extra"] = extra if extra is not None else dict()
-        response["total"] = len(data) if isinstance(data, list) else 0
+        if data is None:
+            response["data"] = {}
+        else:
+            response["data"] = data
+            if isinstance(data, list):
+                response["total"] = len(data)
+        response["extra"] = {} if extra is None else extra
         return Response(data=response, status=status)
 
+    def set_error_response(self, error, reason, status=drf_status.HTTP_400_BAD_REQUEST):
+        """设置错误响应，记录错误日志，并在处于事务中时标记回滚
+
+        Args:
+            error(str): 错误信息
+            reason(str): 错误原因
+            status(int): 状态码
+
+        Returns:
+            response(Response): 响应数据
+        """
+        if transaction.get_connection().in_atomic_block:
+            transaction.set_rollback(True)
+        logger.error("请求异常：%s, %s", error, reason)
+        return self.set_response(error, reason, status=status)
+
     def set_json(self, data):
         """设置前端响应json数据
 
@@ -85,9 +487,158 @@ class BasicResponseMixin:
         }
 
 
-class BasicListModelMixin(mixins.ListModelMixin, BasicResponseMixin):
+class BasicRelatedQuerySetMixin:
+    """关联数据预加载混合类，子类声明关联字段后，查询时一次性加载关联数据，避免序列化时产生N+1查询；
+    启用auto_related时，还会根据序列化器字段的source自动推导需要预加载的关联字段
+    """
+    auto_related = False  # 是否根据序列化器字段自动推导关联预加载字段，开启后会改变视图的查询语句，需要子类显式开启
+    # 是否根据序列化器字段自动推导only()字段，序列化器或其他处理流程会读取未声明的字段时不要开启，否则会逐行延迟查询
+    auto_only_fields = False
+    select_related_fields = ()  # 通过select_related以JOIN方式加载的外键/一对一字段
+    # 通过prefetch_related以额外IN查询加载的多对多/反向关联字段，需要过滤关联数据时可以使用Prefetch对象；
+    # 关联表数据量较小、或一对多关联会导致JOIN结果行数膨胀时，优先使用prefetch_related
+    prefetch_related_fields = ()
+
+    def get_related_queryset(self, query_set):
+        """为结果集添加关联数据预加载
+
+        Args:
+            query_set(QuerySet): 结果集
+
+        Returns:
+            query_set(QuerySet): 添加了关联数据预加载的结果集
+        """
+        select_related_fields = self.select_related_fields
+        prefetch_related_fields = self.prefetch_related_fields
+
+        if self.auto_related:
+            auto_select, auto_prefetch = _get_auto_related_lookups(self.get_serializer_class())
+            select_related_fields = (*select_related_fields, *auto_select)
+            prefetch_related_fields = (*prefetch_related_fields, *auto_prefetch)
+
+        if select_related_fields:
+            query_set = query_set.select_related(*select_related_fields)
+        if prefetch_related_fields:
+            query_set = query_set.prefetch_related(*prefetch_related_fields)
+
+        if self.auto_only_fields:
+            only_fields = _get_auto_only_fields(self.get_serializer_class())
+            if only_fields:
+                # 同一字段不能既被延迟加载又被select_related遍历，因此select_related路径的第一级必须保留
+                only_fields = {*only_fields, *(field.split('__')[0] for field in select_related_fields)}
+                query_set = query_set.only(*sorted(only_fields))
+        return query_set
+
+    def get_serialized_data(self, instance, many=False):
+        """序列化数据，DEBUG模式下统计序列化期间执行的查询数量，超出结果集本身与预加载所需的查询数量时，
+        说明序列化器访问了未预加载的关联数据，会产生N+1查询，此时记录告警日志
+
+        Args:
+            instance(QuerySet|list|models.Model): 待序列化的数据
+            many(bool): 是否为多条数据
+
+        Returns:
+            data(ReturnList|ReturnDict): 序列化后的数据
+        """
+        serializer = self.get_cached_serializer(instance, many=many)
+        if not settings.DEBUG:
+            return serializer.data
+
+        counter = _QueryCounter()
+        with connection.execute_wrapper(counter):
+            data = serializer.data
+
+        # 未执行的结果集需要1条主查询，prefetch_related的每一级路径各1条查询(如a__b需要a与a__b两条，共同前缀只查询一次)；
+        # 已获取的数据不应再产生查询
+        expected = 0
+        if isinstance(instance, QuerySet) and instance._result_cache is None:
+            levels = set()
+            for lookup in instance._prefetch_related_lookups:
+                parts = getattr(lookup, 'prefetch_to', lookup).split('__')
+                levels.update('__'.join(parts[:index]) for index in range(1, len(parts) + 1))
+            expected = 1 + len(levels)
+        if counter.count > expected:
+            logger.warning("%s序列化时执行了%s条查询，预期最多%s条，可能存在未预加载的关联字段",
+                           type(self).__name__, counter.count, expected)
+        return data
+
+
+class BasicListModelMixin(mixins.ListModelMixin, BasicRelatedQuerySetMixin, BasicResponseMixin):
     """资源列表批量获取的混合类"""
-    query_string_check = ()  # 待校验的查询字符串，如果设置了字段值，则会尝试在执行list流程前对这些字段进行必要性检查
+    query_string_check = frozenset()  # 待校验的查询字符串，如果设置了字段值，则会尝试在执行list流程前对这些字段进行必要性检查
+    cursor_field = 'id'  # 游标分页使用的字段，需要唯一且可排序
+    fast_list_fields = None  # 快速列表字段，设置后list直接通过values()返回字段字典，不再经过序列化器
+    # 是否在响应中返回数据总数，关闭后不执行COUNT查询，分页时多查询一条数据判断是否存在下一页，
+    # 并在extra中返回has_next，此时超出范围的页码不再重置为第一页
+    send_total = True
+    # 是否估算数据总数，开启后在PostgreSQL上对没有任何过滤条件的结果集读取pg_class.reltuples，代替全表COUNT，
+    # 此时超出范围的页码不再重置为第一页
+    estimate_total = False
+    # 列表响应缓存时长(秒)，为None时不缓存；相同查询参数的请求直接返回缓存，模型数据通过本视图集变更后缓存失效，
+    # 结果集或序列化结果与当前用户相关的视图不要开启
+    list_cache_timeout = None
+    # 是否以流式响应返回列表数据，开启后通过iterator()逐块查询、序列化并输出，内存占用与结果集大小无关；
+    # 响应在视图返回后才生成，因此_post_process_list无法读取或修改响应数据，也不会写入列表响应缓存
+    stream_list = False
+    stream_chunk_size = 500  # 流式响应每次查询与序列化的数据量
+
+    def paginate_by_cursor(self, query_set, cursor, limit):
+        """游标分页，获取cursor_field大于cursor的limit条数据，并将下一页的游标写入extra中
+
+        Args:
+            query_set(QuerySet): 过滤后的结果集
+            cursor(str): 上一页最后一条数据的游标值
+            limit(int): 分页大小
+
+        Returns:
+            rows(list): 当前页的数据列表，元素为数据实例，启用fast_list_fields时为字段字典
+        """
+        rows = list(query_set.filter(**{f'{self.cursor_field}__gt': cursor}).order_by(self.cursor_field)[:limit])
+        next_cursor = None
+        if len(rows) == limit:
+            last = rows[-1]
+            next_cursor = last[self.cursor_field] if isinstance(last, dict) else getattr(last, self.cursor_field)
+        self.set_extra(params.PAGINATE_NEXT_CURSOR, next_cursor)
+        return rows
+
+    def get_total_count(self, query_set):
+        """统计结果集的数据总数
+
+        Args:
+            query_set(QuerySet): 过滤后的结果集
+
+        Returns:
+            total(int): 数据总数，估算时为表统计信息中的近似值
+        """
+        if self.estimate_total and not query_set.query.where:
+            connection_ = connections[query_set.db]
+            if connection_.vendor == 'postgresql':
+                with connection_.cursor() as cursor:
+                    cursor.execute(
+                        'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                        [query_set.model._meta.db_table],
+                    )
+                    row = cursor.fetchone()
+                # 从未执行过ANALYZE的表没有统计信息，reltuples为-1
+                if row and row[0] >= 0:
+                    return row[0]
+        return query_set.count()
+
+    @staticmethod
+    def _parse_paginate_value(value):
+        """解析分页参数，只接受正整数
+
+        Args:
+            value(str|None): 查询字符串中的分页参数
+
+        Returns:
+            value(int|None): 解析后的正整数，未传值或取值非法时为None
+        """
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            return None
+        return value if value > 0 else None
 
     def paginate(self, request, *args, **kwargs):
         """分页
@@ -98,32 +649,46 @@ class BasicListModelMixin(mixins.ListModelMixin, BasicResponseMixin):
             **kwargs(dict): 可变关键字参数
 
         Returns:
-            query_set(QuerySet): 结果集
+            query_set(QuerySet|list): 当前页的结果集，切片由数据库通过LIMIT/OFFSET完成；游标分页时为数据列表
+            total(int): 数据总数，游标分页或关闭send_total时为0
         """
-        page = request.query_params.get(params.PAGINATE_PAGE)
-        limit = request.query_params.get(params.PAGINATE_LIMIT)
+        page = self._parse_paginate_value(request.query_params.get(params.PAGINATE_PAGE))
+        limit = self._parse_paginate_value(request.query_params.get(params.PAGINATE_LIMIT))
+        cursor = request.query_params.get(params.PAGINATE_CURSOR)
         paginate_disable = request.META.get(params.PAGINATE_DISABLE)
 
-        # 统计原始数据集总量
         query_set = self.filter_queryset(self.get_queryset())
-        total_count = len(query_set)
-        self._total_count = total_count
 
-        # 如果禁用了分页，则不进行分页操作直接返回所有数据
-        if paginate_disable is not None:
-            return query_set
+        # 快速列表直接查询字段字典，无需实例化model，也无需预加载关联数据
+        if self.fast_list_fields is not None:
+            query_set = query_set.values(*self.fast_list_fields)
+        else:
+            query_set = self.get_related_queryset(query_set)
+
+        # 指定了游标时使用游标分页，查询耗时与页码深度无关，且不需要统计数据总量
+        if paginate_disable is None and cursor is not None and limit:
+            return self.paginate_by_cursor(query_set, cursor, limit), 0
+
+        # 如果禁用了分页，或未指定完整、合法的分页数据，则不进行分页操作直接返回所有数据
+        if paginate_disable is not None or page is None or limit is None:
+            return query_set, self.get_total_count(query_set) if self.send_total else 0
+
+        end = page * limit
+        start = end - limit
 
-        # 如果未指定完整的分页数据，则返回全集数据
-        if not any([page, limit]):
-            return query_set
+        # 不统计数据总数时，多查询一条数据用于判断是否存在下一页
+        if not self.send_total:
+            rows = list(query_set[start:end + 1])
+            self.set_extra(params.PAGINATE_HAS_NEXT, len(rows) > limit)
+            return rows[:limit], 0
 
-        start = (int(page) - 1) * int(limit)
-        end = int(page) * int(limit)
+        # 统计原始数据集总量，用于校验分页起始值
+        total = self.get_total_count(query_set)
 
-        # 如果进行查询时，前端指定了异常的分页数据，则重置分页起始值
-        if start >= self._total_count:
-            start, end = 0, int(limit)
-        return query_set[start:end]
+        # 如果进行查询时，前端指定了异常的分页数据，则重置分页起始值；估算的总数不准确，不能用于判断页码是否越界
+        if start >= total and not self.estimate_total:
+            start, end = 0, limit
+        return query_set[start:end], total
 
     def _pre_process_list(self, request, *args, **kwargs):
         """list请求预处理
@@ -137,10 +702,11 @@ class BasicListModelMixin(mixins.ListModelMixin, BasicResponseMixin):
             error(str): 错误信息，没有错误为None
             reason(str): 错误原因，没有错误为''
         """
-        for _query_string in self.query_string_check:
-            value = request.query_params.get(_query_string)
-            if value is None:
-                return f'Query String {_query_string} is required', f'查询字符串 {_query_string} 为必传字段'
+        # frozenset(frozenset)直接返回原对象，子类声明为tuple时也可兼容
+        missing = frozenset(self.query_string_check) - request.query_params.keys()
+        if missing:
+            _query_string = ', '.join(sorted(missing))
+            return f'Query String {_query_string} is required', f'查询字符串 {_query_string} 为必传字段'
         return None, ''
 
     def _post_process_list(self, request, response, *args, **kwargs):
@@ -171,21 +737,91 @@ class BasicListModelMixin(mixins.ListModelMixin, BasicResponseMixin):
             response(Response): 响应数据
         """
         # 分页处理
-        query_set = self.paginate(request, *args, **kwargs)
+        query_set, self._total_count = self.paginate(request, *args, **kwargs)
 
-        # 获取序列化器
-        serializer = self.get_serializer_class()
+        # 流式响应，游标分页的结果已经是数据列表，无需流式输出
+        if self.stream_list and isinstance(query_set, QuerySet):
+            return StreamingHttpResponse(self._stream_list(query_set), content_type=params.DEFAULT_CONTENT_TYPE)
+
+        # 快速列表的字段字典可直接输出，datetime/Decimal等类型由DRF的JSONEncoder处理
+        if self.fast_list_fields is not None:
+            json_data = self.set_json(list(query_set))
+            return Response(data=json_data, status=drf_status.HTTP_200_OK)
 
         # 序列化queryset
-        data = serializer(query_set, many=True).data
+        data = self.get_serialized_data(query_set, many=True)
 
         # 构造json数据
         json_data = self.set_json(data)
         return Response(data=json_data, status=drf_status.HTTP_200_OK)
 
-    @transaction.atomic()
+    def _stream_list(self, query_set):
+        """逐块生成列表响应的json数据，结构与set_json一致
+
+        Args:
+            query_set(QuerySet): 当前页的结果集
+
+        Returns:
+            content(generator): 响应数据的字节块
+        """
+        encode = JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+        yield f'{{"code":0,"count":{self._total_count},"data":['.encode()
+
+        count, chunk = 0, []
+        for row in query_set.iterator(chunk_size=self.stream_chunk_size):
+            chunk.append(row)
+            if len(chunk) >= self.stream_chunk_size:
+                yield self._encode_stream_chunk(chunk, encode, count == 0)
+                count, chunk = count + len(chunk), []
+        if chunk:
+            yield self._encode_stream_chunk(chunk, encode, count == 0)
+            count += len(chunk)
+
+        msg = "Success" if count else "暂无数据"
+        yield f'],"msg":{encode(msg)},"extra":{encode(self.extra_data)}}}'.encode()
+
+    def _encode_stream_chunk(self, chunk, encode, first):
+        """序列化一块数据并编码为json字节串
+
+        Args:
+            chunk(list): 数据实例列表，快速列表时为字段字典列表
+            encode(callable): json编码函数
+            first(bool): 是否为第一块数据，非第一块数据需要以逗号开头
+
+        Returns:
+            content(bytes): 编码后的数据
+        """
+        data = chunk if self.fast_list_fields is not None else self.get_cached_serializer(chunk, many=True).data
+        content = ','.join(encode(item) for item in data)
+        return (content if first else f',{content}').encode()
+
+    def get_list_cache_key(self, request):
+        """获取列表响应缓存的key，由视图、模型数据版本号、URL参数与完整的查询参数组成
+
+        Args:
+            request(Request): DRF Request
+
+        Returns:
+            key(str|None): 缓存key，模型不存在时为None
+        """
+        model = getattr(self.get_queryset(), 'model', None)
+        if model is None:
+            return None
+
+        # 结果集可能由URL参数限定范围(如/projects/<pk>/items/)，URL参数不同的请求不能共享缓存
+        url_kwargs = urlencode(sorted((key, str(value)) for key, value in self.kwargs.items()))
+        url_kwargs = f'{urlencode([("", str(arg)) for arg in self.args])}#{url_kwargs}'
+        query = urlencode(sorted(request.query_params.lists()), doseq=True)
+        query = f'{url_kwargs}#{query}&{params.PAGINATE_DISABLE}={request.META.get(params.PAGINATE_DISABLE)}'
+        view = type(self)
+        return params.LIST_CACHE_KEY.format(
+            view=f'{view.__module__}.{view.__qualname__}',
+            version=get_list_cache_version(model),
+            query=hashlib.md5(query.encode()).hexdigest(),
+        )
+
     def list(self, request, *args, **kwargs):
-        """list请求,设置事务，并在异常的时候进行回滚
+        """list请求，只读请求不开启事务
 
         Args:
             request(Request): DRF Request
@@ -198,29 +834,32 @@ class BasicListModelMixin(mixins.ListModelMixin, BasicResponseMixin):
         # list请求预处理
         error, reason = self._pre_process_list(request, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
+
+        # 命中列表响应缓存时直接返回
+        cache_key = self.get_list_cache_key(request) if self.list_cache_timeout else None
+        if cache_key is not None:
+            data = cache.get(cache_key)
+            if data is not None:
+                return Response(data=data)
 
         # list请求
         try:
             response = self._perform_list(request, *args, **kwargs)
         except Exception as error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}")
-            return self.set_response('Failed to get model list', f'获取资源数据列表失败,错误信息为{error}',
-                                     status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response('Failed to get model list', f'获取资源数据列表失败,错误信息为{error}')
 
         # list请求后处理
         error, reason, response = self._post_process_list(request, response, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
+
+        if cache_key is not None and isinstance(response, Response) and response.status_code == drf_status.HTTP_200_OK:
+            cache.set(cache_key, response.data, self.list_cache_timeout)
         return response
 
 
-class BasicRetrieveModelMixin(mixins.RetrieveModelMixin, BasicResponseMixin):
+class BasicRetrieveModelMixin(mixins.RetrieveModelMixin, BasicRelatedQuerySetMixin, BasicResponseMixin):
     """单个资源处理流程"""
 
     def _pre_process_retrieve(self, request, *args, **kwargs):
@@ -251,8 +890,7 @@ class BasicRetrieveModelMixin(mixins.RetrieveModelMixin, BasicResponseMixin):
             reason(str): 错误原因，没有错误为''
             response(Response): 响应数据
         """
-        serializer = self.get_serializer_class()
-        data = serializer(instance, many=False).data
+        data = self.get_serialized_data(instance, many=False)
         response = self.set_response(result='Success', data=data, status=drf_status.HTTP_200_OK)
         return None, '', response
 
@@ -271,9 +909,8 @@ class BasicRetrieveModelMixin(mixins.RetrieveModelMixin, BasicResponseMixin):
         """
         return None, ''
 
-    @transaction.atomic()
     def retrieve(self, request, *args, **kwargs):
-        """执行retrieve操作
+        """执行retrieve操作，只读请求不开启事务
 
         Args:
             request(Request): DRF Request
@@ -286,33 +923,28 @@ class BasicRetrieveModelMixin(mixins.RetrieveModelMixin, BasicResponseMixin):
         # 查询预处理
         error, reason = self._pre_process_retrieve(request, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
-        # 获取model instance
-        instance = self.get_object(*args, **kwargs)
+        # 获取model instance，同时预加载序列化时需要的关联数据
+        instance = self.get_object(*args, related=True, **kwargs)
 
         # 查询
         error, reason, response = self._perform_retrieve(request, instance, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
         # 查询后处理
         error, reason = self._post_process_retrieve(request, instance, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
         return response
 
 
 class BasicBulkCreateModelMixin(mixins.CreateModelMixin, BasicResponseMixin):
-    """资源批量创建的混合类"""
-    data_field_check = ()  # post请求体字段校验列表
+    """资源批量创建的混合类，请求体为列表时批量创建，为字典时创建单个资源"""
+    data_field_check = frozenset()  # post请求体字段校验列表
+    bulk_create_batch_size = 500  # 批量创建时每条INSERT语句插入的数据量
 
     def _pre_process_create(self, request, *args, **kwargs):
         """创建请求预处理
@@ -326,10 +958,13 @@ class BasicBulkCreateModelMixin(mixins.CreateModelMixin, BasicResponseMixin):
             error(str): 错误信息，没有错误为None
             reason(str): 错误原因，没有错误为''
         """
-        for field in self.data_field_check:
-            value = request.data.get(field)
-            if value is None:
-                return f'field {field} is required', f'字段 {field} 为必填字段'
+        rows = request.data if isinstance(request.data, list) else (request.data, )
+        missing = frozenset().union(
+            *(frozenset(self.data_field_check) - row.keys() for row in rows if isinstance(row, dict))
+        )
+        if missing:
+            field = ', '.join(sorted(missing))
+            return f'field {field} is required', f'字段 {field} 为必填字段'
         return None, ''
 
     def _pre_validate_create(self, request, *args, **kwargs):
@@ -358,11 +993,70 @@ class BasicBulkCreateModelMixin(mixins.CreateModelMixin, BasicResponseMixin):
         Returns:
             inst(object): 创建完成的资源实例
         """
-        inst = serializer.save()
+        if isinstance(serializer, ListSerializer):
+            return self._perform_bulk_create(request, serializer, *args, **kwargs)
+
+        # 如果资源为通用数据类型，则在同一条INSERT语句中写入默认属性
+        model = getattr(getattr(serializer, 'Meta', None), 'model', None)
+        inst = serializer.save(**self._get_create_defaults(request, model, serializer.validated_data))
         return inst
 
+    def _get_create_defaults(self, request, model, attrs):
+        """获取创建资源时需要写入的默认属性，只有通用数据类型的资源才有默认属性
+
+        Args:
+            request(Request): DRF Request
+            model(models.Model|None): 模型类
+            attrs(dict): 序列化器校验后的数据
+
+        Returns:
+            defaults(dict): 默认属性
+        """
+        if model is None:
+            return {}
+
+        try:
+            data_type_field = model._meta.get_field(params.DATA_TYPE_FIELD)
+        except FieldDoesNotExist:
+            return {}
+
+        if attrs.get(params.DATA_TYPE_FIELD, data_type_field.default) != params.DATA_TYPE_COMMON:
+            return {}
+
+        return {
+            'creator': request.user.username,
+            'last_operator': request.user.username,
+            'last_operation': params.DATA_OPERATION_ADD,
+        }
+
+    def _perform_bulk_create(self, request, serializer, *args, **kwargs):
+        """批量创建资源，通过bulk_create分批插入；序列化器自定义了create，或数据中包含多对多字段时，
+        退回到逐条创建
+
+        Args:
+            request(Request): DRF Request
+            serializer(ListSerializer): many=True的DRF serializer
+            *args(list): 可变参数
+            **kwargs(dict): 可变关键字参数
+
+        Returns:
+            instances(list): 创建完成的资源实例列表
+        """
+        child = serializer.child
+        model = child.Meta.model
+        many_to_many = {field.name for field in model._meta.many_to_many}
+        rows = serializer.validated_data
+
+        custom_create = type(serializer).create is not ListSerializer.create or \
+            type(child).create is not ModelSerializer.create
+        if custom_create or any(many_to_many & attrs.keys() for attrs in rows):
+            return [child.create({**attrs, **self._get_create_defaults(request, model, attrs)}) for attrs in rows]
+
+        objs = [model(**{**attrs, **self._get_create_defaults(request, model, attrs)}) for attrs in rows]
+        return model.objects.bulk_create(objs, batch_size=self.bulk_create_batch_size)
+
     def _post_process_create(self, request, instance, *args, **kwargs):
-        """执行create后的处理流程
+        """执行create后的处理流程，默认属性已在_perform_create中写入，此处仅兼容重写了_perform_create的子类
 
         Args:
             request(Request): DRF Request
@@ -374,20 +1068,19 @@ class BasicBulkCreateModelMixin(mixins.CreateModelMixin, BasicResponseMixin):
             error(str): 错误信息，没有错误为None
             reason(str): 错误原因，没有错误为''
         """
-        try:
-            data_type = getattr(instance, params.DATA_TYPE_FIELD)
-        except AttributeError:
+        if not _has_data_type(type(instance)):
             return None, ''
+        data_type = getattr(instance, params.DATA_TYPE_FIELD)
 
-        # 如果资源为通用数据类型，则添加默认属性
-        if data_type == params.DATA_TYPE_COMMON:
+        # 如果资源为通用数据类型且尚未设置默认属性，则只更新默认属性字段
+        if data_type == params.DATA_TYPE_COMMON and instance.last_operation is None:
             instance.creator = request.user.username
             instance.last_operator = request.user.username
             instance.last_operation = params.DATA_OPERATION_ADD
-            instance.save()
+            instance.save(update_fields=['creator', 'last_operator', 'last_operation'])
         return None, ''
 
-    @transaction.atomic()
+    @transaction.atomic(savepoint=False)
     def create(self, request, *args, **kwargs):
         """资源创建，设置事务，出现错误时进行回滚
 
@@ -402,40 +1095,29 @@ class BasicBulkCreateModelMixin(mixins.CreateModelMixin, BasicResponseMixin):
         # 请求消息预处理
         error, reason = self._pre_process_create(request, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
         # 创建请求预校验
         error, reason = self._pre_validate_create(request, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
-        # 获取serializer
-        serializer = self.get_serializer(data=request.data)
+        # 获取serializer，请求体为列表时批量校验
+        serializer = self.get_serializer(data=request.data, many=isinstance(request.data, list))
         if not serializer.is_valid():
-            transaction.set_rollback(True)
-            logger.error(f"序列化器校验失败:{serializer.errors}")
-            return self.set_response('serializer is invalid', f'序列化器校验失败:{serializer.errors}',
-                                     status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response('serializer is invalid', f'序列化器校验失败:{serializer.errors}')
 
         # 执行创建
         try:
             instances = self._perform_create(request, serializer, *args, **kwargs)
         except Exception as error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}")
-            return self.set_response('Failed to create models', f'执行创建失败,错误信息为:{error}',
-                                     status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response('Failed to create models', f'执行创建失败,错误信息为:{error}')
 
         # 创建后处理
         error, reason = self._post_process_create(request, instances, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
+        self.invalidate_list_cache()
         return self.set_response(params.HTTP_SUCCESS, "创建成功", status=drf_status.HTTP_201_CREATED)
 
 
@@ -500,7 +1182,7 @@ class BasicCreateModelMixin(mixins.CreateModelMixin, BasicResponseMixin):
         """
         return None, ''
 
-    @transaction.atomic()
+    @transaction.atomic(savepoint=False)
     def create(self, request, *args, **kwargs):
         """资源创建，设置事务，出现错误时进行回滚
 
@@ -515,40 +1197,29 @@ class BasicCreateModelMixin(mixins.CreateModelMixin, BasicResponseMixin):
         # 请求消息预处理
         error, reason = self._pre_process_create(request, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
         # 创建请求预校验
         error, reason = self._pre_validate_create(request, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
         # 获取serializer
         serializer = self.get_serializer(data=request.data)
         if not serializer.is_valid():
-            transaction.set_rollback(True)
-            logger.error(f"序列化器校验失败:{serializer.errors}")
-            return self.set_response('serializer is invalid', f'序列化器校验失败:{serializer.errors}',
-                                     status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response('serializer is invalid', f'序列化器校验失败:{serializer.errors}')
 
         # 执行创建
         try:
             instances = self._perform_create(request, serializer, *args, **kwargs)
         except Exception as error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}")
-            return self.set_response('Failed to create models', f'执行创建失败,错误信息为:{error}',
-                                     status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response('Failed to create models', f'执行创建失败,错误信息为:{error}')
 
         # 创建后处理
         error, reason = self._post_process_create(request, instances, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
+        self.invalidate_list_cache()
         return self.set_response(params.HTTP_SUCCESS, "创建成功", status=drf_status.HTTP_201_CREATED)
 
 
@@ -596,17 +1267,21 @@ class BasicBulkUpdateModelMixin(mixins.UpdateModelMixin, BasicResponseMixin):
             reason(str): 错误原因，没有错误为''
             instances(QuerySet): 数据集
         """
-        # 获取更新数据
-        data = copy.deepcopy(request.data)
+        # 浅拷贝更新数据，请求体中只有标量字段与实例ID列表，无需深拷贝
+        if isinstance(request.data, QueryDict):
+            data = request.data.dict()
+            instances_id = request.data.getlist('instances_id')
+        else:
+            data = dict(request.data)
+            instances_id = data.get('instances_id')
 
         # 获取待更新的实例
-        instances_id = data.pop('instances_id')
-        data = data.dict()
+        data.pop('instances_id')
 
         queryset = self.get_queryset(*args, **kwargs)
         queryset = queryset.filter(id__in=instances_id)
 
-        # 执行更新
+        # 执行更新，直接在结果集上生成UPDATE语句，不会查询数据行
         queryset.update(**data)
         return None, '', queryset
 
@@ -625,7 +1300,7 @@ class BasicBulkUpdateModelMixin(mixins.UpdateModelMixin, BasicResponseMixin):
         """
         return None, ''
 
-    @transaction.atomic()
+    @transaction.atomic(savepoint=False)
     def update(self, request, *args, **kwargs):
         """更新操作，设置事务，出现错误时进行数据回滚
 
@@ -640,37 +1315,27 @@ class BasicBulkUpdateModelMixin(mixins.UpdateModelMixin, BasicResponseMixin):
         # 更新前预处理
         error, reason = self._pre_process_update(request, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
         # 更新前预校验
         error, reason = self._validate_update(request, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
         # 执行更新操作
         try:
             error, reason, instances = self._perform_update(request, *args, **kwargs)
         except Exception as error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}")
-            return self.set_response('Update failed', f'更新失败，错误信息为:{error}',
-                                     status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response('Update failed', f'更新失败，错误信息为:{error}')
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
         # 更新后预处理
         error, reason = self._post_process_update(request, instances, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
+        self.invalidate_list_cache()
         return self.set_response(params.HTTP_SUCCESS, '批量更新成功')
 
 
@@ -717,7 +1382,12 @@ class BasicUpdateModelMixin(mixins.UpdateModelMixin, BasicResponseMixin):
             error(str): 错误信息，没有错误为None
             reason(str): 错误原因，没有错误为''
         """
-        serializer.save()
+        # 通用数据类型的操作审计信息随本次更新一并保存，不再单独执行一次save()
+        instance = serializer.instance
+        if _has_data_type(type(instance)) and getattr(instance, params.DATA_TYPE_FIELD) == params.DATA_TYPE_COMMON:
+            serializer.save(last_operator=self.request.user.username, last_operation=params.DATA_OPERATION_MODIFY)
+        else:
+            serializer.save()
         return None, ''
 
     def _perform_partial_update(self, request, instance, *args, **kwargs):
@@ -733,18 +1403,29 @@ class BasicUpdateModelMixin(mixins.UpdateModelMixin, BasicResponseMixin):
             error(str): 错误信息，没有错误为None
             reason(str): 错误原因，没有错误为''
         """
-        # 执行部分更新
+        # 执行部分更新，只对请求中的字段执行一次UPDATE，通用数据类型的操作审计信息在同一条UPDATE语句中写入
+        error, reason, update_data = _get_update_data(type(instance), request.data)
+        if error:
+            return error, reason
+
         try:
-            for key, value in request.data.items():
+            if _has_data_type(type(instance)) and getattr(instance, params.DATA_TYPE_FIELD) == params.DATA_TYPE_COMMON:
+                update_data.update(
+                    last_operator=request.user.username,
+                    last_operation=params.DATA_OPERATION_MODIFY,
+                )
+            type(instance)._default_manager.filter(pk=instance.pk).update(**update_data)
+
+            # 同步实例属性，避免再次查询
+            for key, value in update_data.items():
                 setattr(instance, key, value)
-            instance.save()
         except Exception as error:
-            logger.error(f"部分更新失败: {instance.__dict__}")
+            logger.error("部分更新失败: %s", instance.__dict__)
             return error, '部分更新失败'
         return None, ''
 
     def _post_process_update(self, request, instance, *args, **kwargs):
-        """更新完成后处理流程
+        """更新完成后处理流程，操作审计信息已在_perform_update/_perform_partial_update中写入
 
         Args:
             request(Request): DRF Request
@@ -756,19 +1437,9 @@ class BasicUpdateModelMixin(mixins.UpdateModelMixin, BasicResponseMixin):
             error(str): 错误信息，没有错误为None
             reason(str): 错误原因，没有错误为''
         """
-        try:
-            data_type = getattr(instance, params.DATA_TYPE_FIELD)
-        except AttributeError:
-            return None, ''
-
-        # 更新操作后设置默认数据
-        if data_type == params.DATA_TYPE_COMMON:
-            instance.last_operator = request.user.username
-            instance.last_operation = params.DATA_OPERATION_MODIFY
-            instance.save()
         return None, ''
 
-    @transaction.atomic()
+    @transaction.atomic(savepoint=False)
     def update(self, request, *args, **kwargs):
         """更新操作，设置事务，出现错误时进行数据回滚
 
@@ -783,16 +1454,12 @@ class BasicUpdateModelMixin(mixins.UpdateModelMixin, BasicResponseMixin):
         # 更新前预处理
         error, reason = self._pre_process_update(request, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
         # 更新前预校验
         error, reason = self._validate_update(request, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
         # 获取model instance
         instance = self.get_object(*args, **kwargs)
@@ -803,38 +1470,27 @@ class BasicUpdateModelMixin(mixins.UpdateModelMixin, BasicResponseMixin):
             # 执行部分更新
             error, reason = self._perform_partial_update(request, instance, *args, **kwargs)
             if error:
-                transaction.set_rollback(True)
-                logger.error(f"请求异常：{error}, {reason}")
-                return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+                return self.set_error_response(error, reason)
         else:
             # 获取序列化器
             serializer = self.get_serializer(instance, data=request.data)
             if not serializer.is_valid():
-                transaction.set_rollback(True)
-                logger.error(f"序列化器校验失败，错误信息为:{serializer.errors}")
-                return self.set_response('Serializer validate failed', f'序列化器校验失败，错误信息为:{serializer.errors}',
-                                         status=drf_status.HTTP_400_BAD_REQUEST)
+                return self.set_error_response('Serializer validate failed', f'序列化器校验失败，错误信息为:{serializer.errors}')
 
             # 执行全量更新操作
             try:
                 error, reason = self._perform_update(serializer, *args, **kwargs)
             except Exception as error:
-                transaction.set_rollback(True)
-                logger.error(f"请求异常：{error}")
-                return self.set_response('Update failed', f'更新失败，错误信息为:{error}',
-                                         status=drf_status.HTTP_400_BAD_REQUEST)
+                return self.set_error_response('Update failed', f'更新失败，错误信息为:{error}')
             if error:
-                transaction.set_rollback(True)
-                logger.error(f"请求异常：{error}, {reason}")
-                return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+                return self.set_error_response(error, reason)
 
         # 更新后预处理
         error, reason = self._post_process_update(request, instance, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
+        self.invalidate_list_cache()
         return self.set_response(params.HTTP_SUCCESS, '更新成功')
 
 
@@ -888,7 +1544,7 @@ class BasicBulkDestroyModelMixin(mixins.DestroyModelMixin, BasicResponseMixin):
             instances.update(is_delete=True)
             return None, '', instances
 
-        # 物理删除
+        # 物理删除，Django收集级联对象时只会读取主键列
         instances.delete()
         return None, '', None
 
@@ -917,13 +1573,22 @@ class BasicBulkDestroyModelMixin(mixins.DestroyModelMixin, BasicResponseMixin):
 
         Returns:
             instances(QuerySet): 实例集
+
+        Raises:
+            ValueError: deleted中存在无法转换为整数的id
         """
-        delete_data = request.data.get('deleted', '')
+        delete_data = request.data.get('deleted') or ''
         query_set = self.get_queryset(*args, **kwargs)
-        instances = query_set.filter(id__in=delete_data.split(params.SPLIT_COMMA))
+        # 没有待删除的id时直接返回空结果集，不会产生数据库查询
+        if not delete_data:
+            return query_set.none()
+
+        ids = [int(i) for i in delete_data.split(params.SPLIT_COMMA) if i]
+        # 删除时只需要主键，逻辑删除与物理删除都直接作用于该结果集，不要提前list()
+        instances = query_set.filter(id__in=ids).only('pk')
         return instances
 
-    @transaction.atomic()
+    @transaction.atomic(savepoint=False)
     def destroy(self, request, *args, **kwargs):
         """删除主流程
 
@@ -938,44 +1603,40 @@ class BasicBulkDestroyModelMixin(mixins.DestroyModelMixin, BasicResponseMixin):
         # 删除预处理
         error, reason = self._pre_process_delete(request, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
         # 删除预校验
         error, reason = self._validate_delete(request, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
         # 获取待删除的实例集
-        insts = self.get_delete_instances(request, *args, **kwargs)
+        try:
+            insts = self.get_delete_instances(request, *args, **kwargs)
+        except ValueError as error:
+            return self.set_error_response('Invalid deleted', f'待删除的id不合法，错误信息为:{error}')
 
         # 执行删除
         try:
             error, reason, instances = self._perform_delete(insts, *args, **kwargs)
         except Exception as error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}")
-            return self.set_response('Delete failed', f'删除失败，错误信息为:{error}',
-                                     status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response('Delete failed', f'删除失败，错误信息为:{error}')
         if error:
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
         # 删除后处理
         error, reason = self._post_process_delete(request, instances, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
+        self.invalidate_list_cache()
         return self.set_response(params.HTTP_SUCCESS, '删除成功', status=drf_status.HTTP_200_OK)
 
 
 class BasicDestroyModelMixin(mixins.DestroyModelMixin, BasicResponseMixin):
     """删除model"""
+    # 获取待删除实例时只查询的字段，模型中不存在的字段会被忽略，子类的处理流程需要读取其他字段时设置为None
+    destroy_only_fields = (params.DEFAULT_PK, 'is_delete', params.DATA_TYPE_FIELD)
 
     def _pre_process_delete(self, request, *args, **kwargs):
         """删除预处理
@@ -1018,11 +1679,22 @@ class BasicDestroyModelMixin(mixins.DestroyModelMixin, BasicResponseMixin):
             reason(str): 错误原因，没有错误为''
             instances(object): 已逻辑删除的实例(物理删除的实例则为None)
         """
-        # 执行逻辑删除
+        # 执行逻辑删除，通用数据类型一并写入操作审计信息，只产生一条UPDATE语句；update()不会触发auto_now，需补充更新时间
         logic_delete = self.request.query_params.get('logic_delete', False)
         if logic_delete:
-            instance.is_delete = True
-            instance.save()
+            _, auto_now_fields = _get_updatable_fields(type(instance))
+            update_data = dict.fromkeys(auto_now_fields, timezone.now())
+            update_data['is_delete'] = True
+            if _has_data_type(type(instance)) and getattr(instance, params.DATA_TYPE_FIELD) == params.DATA_TYPE_COMMON:
+                update_data.update(
+                    last_operator=self.request.user.username,
+                    last_operation=params.DATA_OPERATION_DELETE,
+                )
+            type(instance)._default_manager.filter(pk=instance.pk).update(**update_data)
+
+            # 同步实例属性，避免再次查询
+            for key, value in update_data.items():
+                setattr(instance, key, value)
             return None, '', instance
 
         # 执行物理删除
@@ -1030,7 +1702,7 @@ class BasicDestroyModelMixin(mixins.DestroyModelMixin, BasicResponseMixin):
         return None, '', None
 
     def _post_process_delete(self, request, instance, *args, **kwargs):
-        """删除后处理，如果为逻辑删除，则记录逻辑删除操作相关的操作审计信息
+        """删除后处理，逻辑删除的操作审计信息已在_perform_delete中写入
 
         Args:
             request(Request): DRF Request
@@ -1042,20 +1714,9 @@ class BasicDestroyModelMixin(mixins.DestroyModelMixin, BasicResponseMixin):
             error(str): 错误信息，没有错误为None
             reason(str): 错误原因，没有错误为''
         """
-        try:
-            data_type = getattr(instance, params.DATA_TYPE_FIELD)
-        except AttributeError:
-            return None, ''
-
-        # 逻辑删除操作后设置默认数据
-        logic_delete = request.query_params.get('logic_delete', False)
-        if data_type == params.DATA_TYPE_COMMON and logic_delete:
-            instance.last_operator = request.user.username
-            instance.last_operation = params.DATA_OPERATION_DELETE
-            instance.save()
         return None, ''
 
-    @transaction.atomic()
+    @transaction.atomic(savepoint=False)
     def destroy(self, request, *args, **kwargs):
         """删除主流程
 
@@ -1070,44 +1731,36 @@ class BasicDestroyModelMixin(mixins.DestroyModelMixin, BasicResponseMixin):
         # 删除预处理
         error, reason = self._pre_process_delete(request, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
         # 删除预校验
         error, reason = self._validate_delete(request, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
         # 获取数据对象
-        inst = self.get_object(*args, **kwargs)
+        inst = self.get_object(*args, only=self.destroy_only_fields, **kwargs)
 
         # 执行删除
         try:
             error, reason, instance = self._perform_delete(inst, *args, **kwargs)
         except Exception as error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}")
-            return self.set_response('Delete failed', f'删除失败，错误信息为:{error}',
-                                     status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response('Delete failed', f'删除失败，错误信息为:{error}')
         if error:
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
         # 删除后处理
         error, reason = self._post_process_delete(request, instance, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
+        self.invalidate_list_cache()
         return self.set_response(params.HTTP_SUCCESS, '删除成功', status=drf_status.HTTP_200_OK)
 
 
 class BasicBulkPatchModelMixin(BasicResponseMixin):
     """批量处理patch请求的混合类"""
+    bulk_patch_batch_size = 1000  # 逐行批量更新时每条SQL语句更新的数据量
 
     def _pre_process_patch(self, request, *args, **kwargs):
         """patch请求预处理
@@ -1151,8 +1804,71 @@ class BasicBulkPatchModelMixin(BasicResponseMixin):
             reason(str): 错误原因，没有错误为''
             response(Response): 请求响应数据
         """
-        # 执行部分更新
-        instances.update(**request.data)
+        # 请求数据为列表时，按行更新不同的值
+        if isinstance(request.data, list):
+            return self._perform_rows_patch(request, instances, *args, **kwargs)
+
+        # 只保留模型中真实存在的字段，在一条UPDATE语句中完成批量部分更新
+        allowed, _ = _get_updatable_fields(instances.model)
+        data = {key: request.data[key] for key in request.data.keys() & allowed.keys()}
+        if not data:
+            return 'Invalid patch data', '请求中没有可更新的字段', None
+        if len({allowed[key] for key in data}) != len(data):
+            return 'Invalid patch data', '外键字段不能同时以字段名和attname传入', None
+        instances.update(**data)
+
+        response = self.set_response(params.HTTP_SUCCESS, data="批量部分更新成功")
+        return None, '', response
+
+    def _perform_rows_patch(self, request, instances, *args, **kwargs):
+        """按行执行批量部分更新，请求数据为[{"pk": 1, "field": value}, ...]，每行需要更新相同的字段，
+        通过bulk_update分批生成CASE WHEN语句，避免逐行save()
+
+        Args:
+            request(Request): DRF Request
+            instances(QuerySet): query set，只有其中的数据会被更新
+            *args(list): 可变参数
+            **kwargs(dict): 可变关键字参数
+
+        Returns:
+            error(str): 错误信息，没有错误为None
+            reason(str): 错误原因，没有错误为''
+            response(Response): 请求响应数据
+        """
+        rows = request.data
+        if not rows:
+            return 'Invalid patch data', '请求中没有待更新的数据', None
+
+        model = instances.model
+        allowed, _ = _get_updatable_fields(model)
+        fields = rows[0].keys() & allowed.keys()
+        if not fields:
+            return 'Invalid patch data', '请求中没有可更新的字段', None
+
+        try:
+            pk_list = [row[params.DEFAULT_PK] for row in rows]
+        except (KeyError, TypeError):
+            return 'Invalid patch data', f'每行数据都需要包含{params.DEFAULT_PK}', None
+
+        # bulk_update会写入所有指定的字段，因此每行需要更新的字段必须一致
+        if any(row.keys() & allowed.keys() != fields for row in rows):
+            return 'Invalid patch data', '每行数据需要更新的字段必须一致', None
+
+        # 只允许更新当前结果集中的数据
+        exists = set(instances.filter(pk__in=pk_list).values_list('pk', flat=True))
+        if len(exists) != len(set(pk_list)):
+            return 'Invalid patch data', '部分数据不存在或无权更新', None
+
+        # 外键以name传入时值为主键而非模型实例，统一按attname构造实例，避免外键描述符的类型校验
+        attnames = {field: allowed[field] for field in fields}
+        if len(set(attnames.values())) != len(attnames):
+            return 'Invalid patch data', '外键字段不能同时以字段名和attname传入', None
+
+        objs = [
+            model(pk=row[params.DEFAULT_PK], **{attname: row[field] for field, attname in attnames.items()})
+            for row in rows
+        ]
+        model.objects.bulk_update(objs, fields=sorted(attnames.values()), batch_size=self.bulk_patch_batch_size)
 
         response = self.set_response(params.HTTP_SUCCESS, data="批量部分更新成功")
         return None, '', response
@@ -1172,7 +1888,7 @@ class BasicBulkPatchModelMixin(BasicResponseMixin):
         """
         return None, ''
 
-    @transaction.atomic()
+    @transaction.atomic(savepoint=False)
     def extra(self, request, *args, **kwargs):
         """
 
@@ -1188,16 +1904,12 @@ class BasicBulkPatchModelMixin(BasicResponseMixin):
         # patch请求预处理
         error, reason = self._pre_process_patch(request, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
         # patch请求预校验
         error, reason = self._validate_patch(request, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
         # 获取数据对象
         instances = self.get_queryset()
@@ -1206,26 +1918,23 @@ class BasicBulkPatchModelMixin(BasicResponseMixin):
         try:
             error, reason, response = self._perform_patch(request, instances, *args, **kwargs)
             if error:
-                transaction.set_rollback(True)
-                logger.error(f"请求异常：{error}, {reason}")
-                return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+                return self.set_error_response(error, reason)
         except Exception as error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}")
-            return self.set_response('Failed to patch', f'patch请求处理失败,错误原因:{error}')
+            return self.set_error_response('Failed to patch', f'patch请求处理失败,错误原因:{error}')
 
         # patch请求后处理
         error, reason = self._post_process_patch(request, instances, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
+        self.invalidate_list_cache()
         return response
 
 
 class BasicPatchModelMixin(BasicResponseMixin):
     """patch请求的混合类"""
+    # 获取待更新实例时只查询的字段，模型中不存在的字段会被忽略，子类的处理流程需要读取其他字段时设置为None
+    patch_only_fields = (params.DEFAULT_PK, params.DATA_TYPE_FIELD)
 
     def _pre_process_patch(self, request, *args, **kwargs):
         """patch请求预处理
@@ -1269,17 +1978,28 @@ class BasicPatchModelMixin(BasicResponseMixin):
             reason(str): 错误原因，没有错误为''
             response(Response): 请求响应数据
         """
-        # 执行部分更新
-        for key, value in request.data.items():
+        # 执行部分更新，只写入请求中的字段
+        error, reason, update_data = _get_update_data(type(instance), request.data)
+        if error:
+            return error, reason, None
+
+        # 通用数据类型的操作审计信息与本次更新在同一条UPDATE语句中写入
+        if _has_data_type(type(instance)) and getattr(instance, params.DATA_TYPE_FIELD) == params.DATA_TYPE_COMMON:
+            update_data.update(
+                last_operator=request.user.username,
+                last_operation=params.DATA_OPERATION_MODIFY,
+            )
+
+        for key, value in update_data.items():
             setattr(instance, key, value)
 
-        instance.save()
+        instance.save(update_fields=list(update_data))
 
         response = self.set_response(result=params.HTTP_SUCCESS, data="部分更新成功")
         return None, '', response
 
     def _post_process_patch(self, request, instance, *args, **kwargs):
-        """patch请求后处理
+        """patch请求后处理，操作审计信息已在_perform_patch中写入
 
         Args:
             request(Request): DRF Request
@@ -1291,19 +2011,9 @@ class BasicPatchModelMixin(BasicResponseMixin):
             error(str): 错误信息，没有错误为None
             reason(str): 错误原因，没有错误为''
         """
-        try:
-            data_type = getattr(instance, params.DATA_TYPE_FIELD)
-        except AttributeError:
-            return None, ''
-
-        # 更新操作后设置默认数据
-        if data_type == params.DATA_TYPE_COMMON:
-            instance.last_operator = request.user.username
-            instance.last_operation = params.DATA_OPERATION_MODIFY
-            instance.save()
         return None, ''
 
-    @transaction.atomic()
+    @transaction.atomic(savepoint=False)
     def extra(self, request, *args, **kwargs):
         """
 
@@ -1319,37 +2029,29 @@ class BasicPatchModelMixin(BasicResponseMixin):
         # patch请求预处理
         error, reason = self._pre_process_patch(request, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
         # patch请求预校验
         error, reason = self._validate_patch(request, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}, {reason}")
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
         # 获取数据对象
-        instance = self.get_object(*args, **kwargs)
+        instance = self.get_object(*args, only=self.patch_only_fields, **kwargs)
 
         # patch请求执行
         try:
             error, reason, response = self._perform_patch(request, instance, *args, **kwargs)
             if error:
-                transaction.set_rollback(True)
-                logger.error(f"请求异常：{error}, {reason}")
-                return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+                return self.set_error_response(error, reason)
         except Exception as error:
-            transaction.set_rollback(True)
-            logger.error(f"请求异常：{error}")
-            return self.set_response('Failed to patch', f'patch请求处理失败,错误原因:{error}')
+            return self.set_error_response('Failed to patch', f'patch请求处理失败,错误原因:{error}')
 
         # patch请求后处理
         error, reason = self._post_process_patch(request, instance, *args, **kwargs)
         if error:
-            transaction.set_rollback(True)
-            return self.set_response(error, reason, status=drf_status.HTTP_400_BAD_REQUEST)
+            return self.set_error_response(error, reason)
 
+        self.invalidate_list_cache()
         return response
 
 
@@ -1360,6 +2062,18 @@ class BasicAuthPermissionViewMixin(BasicResponseMixin):
     permission_enable = True  # 是否启用权限检查
     http_method_names = ('get', 'post', 'put', 'delete', 'patch')
 
+    def get_serializer_class(self):
+        """获取序列化器类，每个请求都会实例化新的视图对象，因此缓存在实例上即为请求级别的缓存；
+        当前类在MRO中位于GenericAPIView之前，视图中所有获取序列化器类的调用都会经过这里
+
+        Returns:
+            serializer_class(type): 序列化器类
+        """
+        serializer_class = self.__dict__.get('_cached_serializer_class')
+        if serializer_class is None:
+            serializer_class = self._cached_serializer_class = super().get_serializer_class()
+        return serializer_class
+
     def dispatch(self, request, *args, **kwargs):
         """路由分发
 
@@ -1416,17 +2130,47 @@ class BasicAuthPermissionViewMixin(BasicResponseMixin):
         Returns:
             has_perm(bool): 是否拥有权限
         """
-        has_perm = True
-
         # 如果启用的是根权限，则默认所有用户都拥有此权限
         if self.permission_name == permissions.PER_BASE:
-            return has_perm
-
-        if self.permission_enable:
-            # TODO 权限检查需要由子系统自行定义，此处的逻辑后续补充
-            pass
+            return True
+
+        if self.permission_enable is False:
+            return True
+
+        # 同一用户对同一视图、同一请求方法、同一URL参数的校验结果在有效期内直接复用，无法识别用户时不缓存；
+        # URL参数参与缓存key，因此get_permission可以按URL参数(如主键)进行对象级别的权限判断
+        user_pk = getattr(request.user, 'pk', None)
+        if user_pk is None:
+            return self.get_permission(request, *args, **kwargs)
+
+        view = type(self)
+        target = urlencode([('', str(arg)) for arg in args] + sorted((k, str(v)) for k, v in kwargs.items()))
+        key = params.PERMISSION_CACHE_KEY.format(
+            user=user_pk,
+            view=f'{view.__module__}.{view.__qualname__}',
+            method=request.method,
+            target=hashlib.md5(target.encode()).hexdigest(),
+        )
+        has_perm = cache.get(key)
+        if has_perm is None:
+            has_perm = self.get_permission(request, *args, **kwargs)
+            cache.set(key, has_perm, params.PERMISSION_CACHE_TIMEOUT)
         return has_perm
 
+    def get_permission(self, request, *args, **kwargs):
+        """执行实际的权限检查，结果由check_permission缓存
+
+        Args:
+            request(Request): request
+            *args(list): args
+            **kwargs(dict): kwargs
+
+        Returns:
+            has_perm(bool): 是否拥有权限
+        """
+        # TODO 权限检查需要由子系统自行定义，此处的逻辑后续补充
+        return True
+
 
 class BasicCommonViewMixin:
     """视图集的通用混合类，提供通用的处理方法"""
@@ -1449,45 +2193,35 @@ class BasicCommonViewMixin:
         if isinstance(value, str) is False:
             return value
 
-        value = value.rstrip(' ')
-        value = value.lstrip(' ')
-
-        if value in ('undefined', 'null'):
-            value = params.QUERY_STRING_ILLEGAL_VALUE
-
-        if value == 'true':
-            value = True
-
-        if value == 'false':
-            value = False
-
-        if value == 'None':
-            value = None
-
-        return value
+        return _clear_query_string(value)
 
     def initial_query_params(self):
-        """初始化查询参数"""
-        self.request.query_params._mutable = True  # 将QueryDict修改为可变
-
-        _pop_key = list()
-
-        for key, value in self.request.query_params.items():
-            # 清洗value
-            value = self._clear_query_params(value)
+        """初始化查询参数，清洗后的查询参数保存在_cleaned_query_params中，不修改request.query_params
 
-            if isinstance(value, bool):
-                continue
+        Returns:
+            cleaned(QueryDict): 清洗完毕后的查询参数，值为空或非法的查询参数会被删除
+        """
+        cleaned = QueryDict(mutable=True)
 
-            if value == params.QUERY_STRING_ILLEGAL_VALUE:
-                _pop_key.append(key)
+        clear = self._clear_query_params
+        for key, values in self.request.query_params.lists():
+            # 清洗value，如果value没有传值或取值非法，则不保留该查询参数
+            values = [clear(value) for value in values]
+            values = [value for value in values if value != '' and value != params.QUERY_STRING_ILLEGAL_VALUE]
+            if values:
+                cleaned.setlist(key, values)
 
-            if value == '':
-                _pop_key.append(key)
+        cleaned._mutable = False
+        self._cleaned_query_params = cleaned
+        return cleaned
 
-        # 如果value没有传值，则从查询参数中删除
-        for pop_key in _pop_key:
-            self.request.query_params.pop(pop_key)
+    def get_cleaned_query_params(self):
+        """获取清洗后的查询参数，同一请求内只清洗一次
 
-        self.request.query_params._mutable = False
-        return
+        Returns:
+            cleaned(QueryDict): 清洗完毕后的查询参数
+        """
+        cleaned = self.__dict__.get('_cleaned_query_params')
+        if cleaned is None:
+            cleaned = self.initial_query_params()
+        return cleaned
@@ -9,8 +9,6 @@ Record:
     2023/9/14 Create file.
 
 """
-import datetime
-
 from django.db import models
 
 from app import params
@@ -20,8 +18,8 @@ class BasicModel(models.Model):
     """抽象基类"""
     is_delete = models.BooleanField(verbose_name='是否删除', default=False)
     desc = models.CharField(verbose_name="描述", max_length=255, blank=True, null=True)
-    ctime = models.DateTimeField(verbose_name="创建时间", auto_now_add=datetime.datetime.now())
-    mtime = models.DateTimeField(verbose_name="修改时间", auto_now=datetime.datetime.now())
+    ctime = models.DateTimeField(verbose_name="创建时间", auto_now_add=True)
+    mtime = models.DateTimeField(verbose_name="修改时间", auto_now=True)
 
     class Meta:
         abstract = True
@@ -52,8 +50,18 @@ class CommonDataModel(BasicModel):
 class MigrationsHistory(BasicModel):
     app_name = models.CharField(verbose_name="app名称", max_length=255)
     file_name = models.CharField(verbose_name="文件名称", max_length=255)
-    file_content = models.TextField(verbose_name="文件内容")
+    file_content = models.TextField(verbose_name="文件内容", blank=True, default='')
+    compressed_content = models.BinaryField(verbose_name="压缩文件内容", blank=True, null=True)
+    content_format = models.CharField(verbose_name="文件内容格式", max_length=16,
+                                      choices=params.MIGRATIONS_CONTENT_CHOICE,
+                                      default=params.MIGRATIONS_CONTENT_TEXT)
+    content_sha256 = models.CharField(verbose_name="文件内容SHA256", max_length=64, blank=True, default='')
 
     class Meta:
         db_table = 'common_migrations_history'
         verbose_name = "迁移文件备份表"
+        constraints = [
+            models.UniqueConstraint(
+                fields=['app_name', 'file_name', 'content_sha256'], name='uniq_migrations_history_content'
+            ),
+        ]
@@ -27,6 +27,9 @@ LOGIN_EXPIRE_HOUR = 8  # 默认登录过期时长
 PAGINATE_PAGE = 'page'  # 页码字段
 PAGINATE_LIMIT = 'limit'  # 分页大小字段
 PAGINATE_DISABLE = 'PAGINATE_DISABLE'  # 禁用分页字段
+PAGINATE_CURSOR = 'cursor'  # 游标分页字段
+PAGINATE_NEXT_CURSOR = 'next_cursor'  # 下一页游标的响应字段
+PAGINATE_HAS_NEXT = 'has_next'  # 是否存在下一页的响应字段，不统计数据总数时返回
 
 # 系统分隔符
 SPLIT_COMMA = ','
@@ -82,5 +85,21 @@ HTTP_METHOD_CHOICE = (
     (HTTP_METHOD_PATCH, 'PATCH'),
 )
 
+# 权限校验结果缓存
+PERMISSION_CACHE_KEY = 'perm:{user}:{view}:{method}:{target}'  # 缓存key模板
+PERMISSION_CACHE_TIMEOUT = 60  # 缓存过期时长(秒)
+
+# 列表响应缓存
+LIST_CACHE_KEY = 'list:{view}:{version}:{query}'  # 缓存key模板
+LIST_CACHE_VERSION_KEY = 'list-version:{model}'  # 模型数据版本号的缓存key模板，数据变更后递增
+
 # 非法查询字符
 QUERY_STRING_ILLEGAL_VALUE = "illegal-query-string"
+
+# 迁移文件内容存储格式
+MIGRATIONS_CONTENT_TEXT = 'text'  # 以文本形式保存在file_content中
+MIGRATIONS_CONTENT_ZLIB = 'zlib'  # 以zlib压缩后保存在compressed_content中
+MIGRATIONS_CONTENT_CHOICE = (
+    (MIGRATIONS_CONTENT_TEXT, '文本'),
+    (MIGRATIONS_CONTENT_ZLIB, 'zlib压缩'),
+)
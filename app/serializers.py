@@ -14,7 +14,10 @@ from rest_framework import serializers
 
 class SerializerDataCache:
     """序列化器数据缓存，用于缓存查询的数据"""
-    _cache = dict()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache = dict()  # 每个实例独立的缓存，不在实例之间共享
 
     @property
     def cache(self):
@@ -32,20 +35,12 @@ class DoNothingSerializer(serializers.ModelSerializer):
 
 class BasicCommonModelSerializer(serializers.ModelSerializer):
     """基础通用模型序列化器"""
-    context = dict()  # 数据缓存字典
-
-    @staticmethod
-    def _pack_uniq_key(key, salt):
-        """拼装唯一键值
 
-        Args:
-            key(str): 键值
-            salt(str): 唯一混入值
-
-        Returns:
-            uniq_key(str): 唯一键值
-        """
-        return f"{key}-{salt}"
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 数据缓存字典，每个序列化器实例独立，many=True时由同一个child在所有数据间共享
+        # 注意不能使用context作为名称，否则会覆盖DRF序列化器的context属性
+        self._ctx_cache = dict()
 
     def set_cache(self, key, obj, salt):
         """设置数据缓存，通常情况下，表字段的值应该都在当前表的模型内获取到结果，但是有些时候，为了解除表和表的强关联，
@@ -63,8 +58,7 @@ class BasicCommonModelSerializer(serializers.ModelSerializer):
             None
         """
         # 缓存只会保存最新的值，不会进行更新
-        uniq_key = self._pack_uniq_key(key, salt)
-        self.context[uniq_key] = obj
+        self._ctx_cache[(key, salt)] = obj
         return
 
     def get_cache(self, key, salt):
@@ -78,8 +72,25 @@ class BasicCommonModelSerializer(serializers.ModelSerializer):
             status(bool): 是否命中，True为命中，False为未命中
             cache(any): 缓存值，如果未命中则为None
         """
-        uniq_key = self._pack_uniq_key(key, salt)
-        value = self.context.get(uniq_key)
+        value = self._ctx_cache.get((key, salt))
         if value is None:
             return False, None
         return True, value
+
+    def get_or_load_cache(self, key, salt, loader):
+        """获取缓存数据，未命中时调用loader进行真实查询并写入缓存，命中与写入共用同一个键值
+
+        Args:
+            key(str): 缓存键值
+            salt(str|int): 缓存键值的混入值
+            loader(callable): 未命中时调用的查询函数，调用方式为loader(salt)
+
+        Returns:
+            cache(any): 缓存值或查询结果，查询结果为None时同样会被缓存
+        """
+        uniq_key = (key, salt)
+        try:
+            return self._ctx_cache[uniq_key]
+        except KeyError:
+            value = self._ctx_cache[uniq_key] = loader(salt)
+            return value
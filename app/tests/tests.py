@@ -1,3 +1,129 @@
-from django.test import TestCase
+import os
+import tempfile
+from io import StringIO
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+from django.core.management import call_command
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import path
+from rest_framework import serializers
+from rest_framework.generics import GenericAPIView
+from rest_framework.request import Request
+
+from app.management.commands.syncmigrate import Command as SyncCommand
+from app.models import MigrationsHistory
+from app.mixin.views import BasicResponseMixin
+
+
+def _detail(request, pk):
+    pass
+
+
+urlpatterns = [
+    path('children/<int:pk>/', _detail, name='child-detail'),
+]
+
+
+class ChildSerializer(serializers.Serializer):
+    name = serializers.CharField()
+
+
+class ParentSerializer(serializers.Serializer):
+    name = serializers.CharField()
+    children = ChildSerializer(many=True)
+    links = serializers.HyperlinkedRelatedField(many=True, read_only=True, view_name='child-detail')
+
+
+class ParentView(BasicResponseMixin, GenericAPIView):
+    serializer_class = ParentSerializer
+
+
+@override_settings(ROOT_URLCONF=__name__, ALLOWED_HOSTS=['*'])
+class CachedSerializerTestCase(SimpleTestCase):
+    """复用字段模板的序列化器在多次请求间不能共享嵌套字段"""
+
+    def render(self, host):
+        request = Request(RequestFactory().get('/', HTTP_HOST=host))
+        view = ParentView(request=request, format_kwarg=None, kwargs={})
+        instance = SimpleNamespace(
+            name='parent',
+            children=[SimpleNamespace(name='child')],
+            links=[SimpleNamespace(pk=1)],
+        )
+        serializer = view.get_cached_serializer(instance)
+        return serializer, serializer.data
+
+    def test_nested_many_fields_are_rebuilt_per_request(self):
+        first, first_data = self.render('first.example.com')
+        second, second_data = self.render('second.example.com')
+
+        self.assertEqual(first_data['children'], [{'name': 'child'}])
+        self.assertEqual(second_data['children'], [{'name': 'child'}])
+        self.assertEqual(first_data['links'], ['http://first.example.com/children/1/'])
+        self.assertEqual(second_data['links'], ['http://second.example.com/children/1/'])
+
+        # 嵌套序列化器与关联字段的子字段每次都重新构造，并绑定到各自请求的上下文
+        self.assertIsNot(first.fields['children'].child, second.fields['children'].child)
+        self.assertIsNot(first.fields['links'].child_relation, second.fields['links'].child_relation)
+        self.assertIs(second.fields['children'].child.context['request'], second.context['request'])
+        self.assertIs(second.fields['links'].child_relation.context['request'], second.context['request'])
+
+
+class MigrateCommandTestCase(TestCase):
+    """migrate/makemigrations命令在执行迁移文件同步时，同步命令的输出写入父命令的输出流"""
+
+    def setUp(self):
+        # 只替换同步动作本身，SyncCommand的实例化流程保持不变；先实例化一次，使action分发表绑定原始方法
+        SyncCommand()
+        for action in ('save', 'load'):
+            patcher = mock.patch.object(
+                SyncCommand, action, autospec=True, side_effect=lambda sync, action=action: sync.stdout.write(action),
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def call(self, *args, **options):
+        out = StringIO()
+        call_command(*args, stdout=out, no_color=True, **options)
+        return out.getvalue()
+
+    def test_migrate_saves_migrations(self):
+        output = self.call('migrate', verbosity=0)
+        self.assertIn('save', output)
+        self.assertIn('迁移文件同步完成', output)
+
+    def test_makemigrations_loads_migrations(self):
+        output = self.call('makemigrations', load=True, dry_run=True, verbosity=0)
+        self.assertIn('load', output)
+        self.assertIn('迁移文件读取完成', output)
+
+
+class SyncMigrationsTestCase(TestCase):
+    """迁移文件内容回退到历史版本后，load恢复的是最后一次保存的内容"""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = directory.name
+        self.file = os.path.join(self.path, '0001_initial.py')
+
+        patcher = mock.patch.object(SyncCommand, 'get_app_migrations_dir', return_value={'app': self.path})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def save(self, content):
+        with open(self.file, 'w', encoding='UTF-8') as file:
+            file.write(content)
+        SyncCommand(stdout=StringIO()).save()
+
+    def test_reverted_content_is_loaded(self):
+        self.save('A')
+        self.save('B')
+        self.save('A')
+        self.assertEqual(MigrationsHistory.objects.filter(app_name='app').count(), 2)
+
+        os.remove(self.file)
+        SyncCommand(stdout=StringIO()).load()
+        with open(self.file, encoding='UTF-8') as file:
+            self.assertEqual(file.read(), 'A')
@@ -10,8 +10,50 @@ Record:
 
 """
 import datetime
-
-from app.params import DATETIME_STANDARD
+import re
+
+from app.params import DATE_STANDARD, DATETIME_STANDARD
+
+# 终端输出的字体颜色
+_COLORS = {
+    "black": 30,
+    "red": 31,
+    "green": 32,
+    "yellow": 33,
+    "blue": 34,
+    "pink": 35,
+    "cyan": 36,
+    "white": 37,
+}
+
+# 终端输出的背景颜色
+_BGCOLORS = {
+    "black": 40,
+    "red": 41,
+    "green": 42,
+    "yellow": 43,
+    "blue": 44,
+    "pink": 45,
+    "cyan": 46,
+    "white": 47,
+}
+
+# 终端输出的显示方式
+_DISPLAYS = {
+    "终端默认": 0,
+    "高亮": 1,
+    "非高亮": 22,
+    "下划线": 4,
+    "去下划线": 24,
+    "闪烁": 5,
+    "去闪烁": 25,
+    "反白": 7,
+    "非反白": 27,
+    "不可见": 8,
+    "可见": 28,
+}
+
+_OUTPUT_FORMATTER = "\033[{0};{1};{2}m{3}\033[0m".format
 
 
 def strftime(obj, formatter=DATETIME_STANDARD):
@@ -24,7 +66,17 @@ def strftime(obj, formatter=DATETIME_STANDARD):
     Returns:
         result(str): 标准时间字符串
     """
-    return datetime.datetime.strftime(obj, formatter) if obj else obj
+    if not obj:
+        return obj
+
+    # 默认格式且不带时区的datetime与isoformat结果一致，无需解析格式化字符串
+    if formatter is DATETIME_STANDARD and type(obj) is datetime.datetime and obj.tzinfo is None:
+        return obj.isoformat(sep=' ', timespec='seconds')
+    return datetime.datetime.strftime(obj, formatter)
+
+
+_DATE_STANDARD_PATTERN = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')  # 默认日期格式的精确布局
+_DATETIME_STANDARD_PATTERN = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}:[0-9]{2}')  # 默认格式的精确布局
 
 
 def strptime(time, formatter=DATETIME_STANDARD):
@@ -37,7 +89,14 @@ def strptime(time, formatter=DATETIME_STANDARD):
     Returns:
         result(datetime.datetime): 时间日期对象
     """
-    return datetime.datetime.strptime(time, formatter) if time else time
+    if not time:
+        return time
+
+    # fromisoformat比strptime宽松(如接受T分隔符)，只有完全符合默认格式布局的字符串才走快速路径，保证两者行为一致
+    if formatter is DATETIME_STANDARD and len(time) == 19 and time[10] == ' ' and \
+            _DATETIME_STANDARD_PATTERN.fullmatch(time):
+        return datetime.datetime.fromisoformat(time)
+    return datetime.datetime.strptime(time, formatter)
 
 
 def output_formatter(message, color="green", bgcolor="black", display="高亮"):
@@ -52,44 +111,10 @@ def output_formatter(message, color="green", bgcolor="black", display="高亮"):
     Returns:
         message(str): 格式化后的message
     """
-    colors = {
-        "black": 30,
-        "red": 31,
-        "green": 32,
-        "yellow": 33,
-        "blue": 34,
-        "pink": 35,
-        "cyan": 36,
-        "white": 37,
-    }
-    bgcolors = {
-        "black": 40,
-        "red": 41,
-        "green": 42,
-        "yellow": 43,
-        "blue": 44,
-        "pink": 45,
-        "cyan": 46,
-        "white": 47,
-    }
-    displays = {
-        "终端默认": 0,
-        "高亮": 1,
-        "非高亮": 22,
-        "下划线": 4,
-        "去下划线": 24,
-        "闪烁": 5,
-        "去闪烁": 25,
-        "反白": 7,
-        "非反白": 27,
-        "不可见": 8,
-        "可见": 28,
-    }
-    formatter = "\033[{0};{1};{2}m{3}\033[0m"
-    return formatter.format(
-        displays.get(display, "终端默认"),
-        colors.get(color, "green"),
-        bgcolors.get(bgcolor, "black"),
+    return _OUTPUT_FORMATTER(
+        _DISPLAYS.get(display, _DISPLAYS["终端默认"]),
+        _COLORS.get(color, _COLORS["green"]),
+        _BGCOLORS.get(bgcolor, _BGCOLORS["black"]),
         message
     )
 
@@ -103,10 +128,13 @@ def get_week(date=None):
     Returns:
         week(list): 指定日期所在周的周一至周日的日期列表
     """
-    week = list()
-    date = datetime.date.today() if date is None else datetime.datetime.strptime(date, "%Y-%m-%d").date()
-    sunday = date + datetime.timedelta(days=7 - date.isoweekday())
-    for i in range(7):
-        tmp = sunday - datetime.timedelta(days=i)
-        week.insert(0, tmp.strftime("%Y-%m-%d"))
-    return week
+    if date is None:
+        date = datetime.date.today()
+    elif _DATE_STANDARD_PATTERN.fullmatch(date):
+        date = datetime.date.fromisoformat(date)
+    else:
+        # fromisoformat比strptime宽松(如接受20230919)，同时不接受未补零的日期，非精确布局的日期仍由strptime解析
+        date = datetime.datetime.strptime(date, DATE_STANDARD).date()
+    monday = date - datetime.timedelta(days=date.isoweekday() - 1)
+    # date.isoformat()的结果即为"%Y-%m-%d"格式
+    return [(monday + datetime.timedelta(days=i)).isoformat() for i in range(7)]
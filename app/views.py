@@ -9,15 +9,23 @@ Record:
     2023/9/14 Create file.
 
 """
+import json
+from concurrent.futures import ThreadPoolExecutor
+
 from django.db.models import QuerySet
+from django.http import HttpResponse
 
 from app.exceptions.http import ModelPrimaryKeyError
 from app.mixin import views as views_mixin
 from rest_framework.generics import GenericAPIView
+from rest_framework.utils.encoders import JSONEncoder
 
 from app import params
 from app.serializers import DoNothingSerializer
 
+# 不作为过滤条件的查询参数
+_RESERVED_QUERY_PARAMS = frozenset((params.PAGINATE_PAGE, params.PAGINATE_LIMIT, params.PAGINATE_CURSOR))
+
 
 class BasicListViewSet(views_mixin.BasicAuthPermissionViewMixin,
                        GenericAPIView,
@@ -45,18 +53,15 @@ class BasicListViewSet(views_mixin.BasicAuthPermissionViewMixin,
         Returns:
             QuerySet: 过滤后的QuerySet
         """
-        self.initial_query_params()
+        query_params = self.get_cleaned_query_params()
 
-        _query_params = dict()
+        # 处理查询条件，查询参数已在get_cleaned_query_params中完成清洗
+        _query_params = {key: value for key, value in query_params.items() if key not in _RESERVED_QUERY_PARAMS}
 
-        # 处理查询条件
-        for key, value in self.request.query_params.items():
-            if key not in (params. PAGINATE_PAGE, params.PAGINATE_LIMIT):
-                value = self._clear_query_params(value)
-                _query_params[key] = value
-        queryset = queryset.filter(**_query_params)
-
-        return queryset
+        # 没有查询条件时无需再克隆一次QuerySet
+        if not _query_params:
+            return queryset
+        return queryset.filter(**_query_params)
 
     def get(self, request, *args, **kwargs):
         """批量获取资源数据
@@ -141,11 +146,24 @@ class BasicInfoViewSet(views_mixin.BasicAuthPermissionViewMixin,
     5.资源处理（通过patch方法进行额外的逻辑控制，比如字段查重、局部更新等）
     """
 
-    def get_object(self, *args, **kwargs):
+    def get_queryset(self):
+        """获取QuerySet，每个请求都会实例化新的视图对象，因此缓存在实例上即为请求级别的缓存
+
+        Returns:
+            query_set(QuerySet): 结果集
+        """
+        query_set = self.__dict__.get('_queryset_cache')
+        if query_set is None:
+            query_set = self._queryset_cache = super().get_queryset()
+        return query_set
+
+    def get_object(self, *args, related=False, only=None, **kwargs):
         """获取models.Model对象
 
         Args:
             *args(list): 可变参数
+            related(bool): 是否预加载select_related_fields/prefetch_related_fields声明的关联数据
+            only(tuple|None): 只查询的字段，模型中不存在的字段会被忽略，为None时查询所有字段
             **kwargs(dict): 可变关键字参数
 
         Returns:
@@ -156,7 +174,13 @@ class BasicInfoViewSet(views_mixin.BasicAuthPermissionViewMixin,
         if not pk:
             raise ModelPrimaryKeyError('There is no primary key settled')
 
-        instance = self.get_queryset().get(**{params.DEFAULT_PK: pk})
+        query_set = self.get_queryset()
+        if related:
+            query_set = self.get_related_queryset(query_set)
+        if only:
+            query_set = query_set.only(*(field for field in only if hasattr(query_set.model, field)))
+
+        instance = query_set.get(**{params.DEFAULT_PK: pk})
         return instance
 
     def get(self, request, *args, **kwargs):
@@ -231,21 +255,47 @@ class BasicChoiceListViewSet(BasicListViewSet):
     serializer_class = DoNothingSerializer
     http_method_names = ('get', )
     choice = ()
+    _choice_payload = []  # 由choice生成的响应数据，在子类定义时生成
+    _choice_content = None  # 序列化后的响应消息，首次请求时生成
+
+    def __init_subclass__(cls, **kwargs):
+        """子类定义时根据choice预先生成响应数据，choice为类级别的常量，无需每次请求重新生成"""
+        super().__init_subclass__(**kwargs)
+        cls._choice_payload = [
+            {"id": _index, "label": label, "value": value} for _index, (value, label) in enumerate(cls.choice)
+        ]
+        cls._choice_content = None
 
     def get(self, request, *args, **kwargs):
-        data = list()
-        for _index, _choice in enumerate(self.choice):
-            value, label = _choice
-            data.append({
-                "id": _index,
-                "label": label,
-                "value": value
-            })
-        return self.set_response(result='success', data=data)
+        # 响应消息与请求无关，首次请求时序列化并缓存在类上，之后直接返回，不再经过DRF的渲染流程
+        content = type(self)._choice_content
+        if content is None:
+            body = self.set_response(result='success', data=self._choice_payload).data
+            content = json.dumps(body, cls=JSONEncoder, ensure_ascii=False, separators=(',', ':')).encode()
+            type(self)._choice_content = content
+        return HttpResponse(content, content_type=params.DEFAULT_CONTENT_TYPE)
 
 
 class BasicCustomizeViewSet(BasicListViewSet):
     """自定义视图集，主要用于不需要使用序列化器和模型数据的第三方数据接口"""
     queryset = QuerySet()
     serializer_class = DoNothingSerializer
-    http_method_names = ('get', 'post', 'put', 'delete', 'patch')
\ No newline at end of file
+    http_method_names = ('get', 'post', 'put', 'delete', 'patch')
+    fanout_max_workers = 8  # 并发调用第三方接口的最大线程数
+
+    def fanout(self, *tasks):
+        """并发执行多个第三方接口调用，总耗时取决于最慢的一个调用，而不是所有调用耗时之和；
+        调用在线程池中执行，因此不要在其中使用ORM，否则每个线程都会创建新的数据库连接
+
+        Args:
+            *tasks(callable): 无参数的调用函数，如functools.partial(requests.get, url)
+
+        Returns:
+            results(list): 调用结果，顺序与tasks一致，任意调用抛出的异常会在此处重新抛出
+        """
+        if len(tasks) <= 1:
+            return [task() for task in tasks]
+
+        with ThreadPoolExecutor(max_workers=min(self.fanout_max_workers, len(tasks))) as executor:
+            futures = [executor.submit(task) for task in tasks]
+            return [future.result() for future in futures]